@@ -8,24 +8,23 @@ import argparse
 import sys
 from pathlib import Path
 
-from data_sanitizer.detectors import (
-    CreditCardDetector,
-    EmailDetector,
-    PhoneDetector,
-)
-from data_sanitizer.detectors.name_detector import NameDetector
+from data_sanitizer.detectors import Detector, MultiRegexDetector
 from data_sanitizer.replacer import Replacer
 from data_sanitizer.sanitizer import Sanitizer
 
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments.
 
+    Args:
+        argv: Arguments to parse, without the program name. Defaults to
+            sys.argv[1:].
+
     Returns:
         Parsed arguments containing input_file, output_file, and optional flags
 
     Example:
-        >>> args = parse_arguments()
+        >>> args = parse_arguments(["input.json", "output.json"])
         >>> print(args.input_file)
         'input.json'
     """
@@ -40,6 +39,8 @@ def parse_arguments() -> argparse.Namespace:
 Examples:
   data-sanitizer input.json output.json
   data-sanitizer dirty_data.json clean_data.json --verbose
+  data-sanitizer big_data.json clean_data.json --workers 0
+  data-sanitizer logs.json clean_logs.json --no-names
 
 For more information, visit: https://github.com/yourusername/data-sanitizer
         """,
@@ -63,10 +64,23 @@ For more information, visit: https://github.com/yourusername/data-sanitizer
         help="Enable verbose output with detailed processing information",
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--no-names",
+        action="store_true",
+        help="Skip person name detection (avoids loading the Presidio/spaCy model)",
+    )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used for PII detection (0 = one per CPU core, default: 1)",
+    )
 
-def main() -> int:
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
     """Entry point for the CLI application.
 
     This function orchestrates the entire sanitization workflow:
@@ -76,6 +90,10 @@ def main() -> int:
     4. Display results or error messages
     5. Return appropriate exit code
 
+    Args:
+        argv: Arguments to parse, without the program name. Defaults to
+            sys.argv[1:].
+
     Returns:
         Exit code: 0 for success, 1 for failure
 
@@ -84,7 +102,7 @@ def main() -> int:
     """
     try:
         # Parse arguments
-        args = parse_arguments()
+        args = parse_arguments(argv)
 
         if args.verbose:
             print("Smart Data Sanitizer")
@@ -93,25 +111,30 @@ def main() -> int:
             print(f"Output file: {args.output_file}")
             print()
 
-        # Initialize detectors
-        detectors = [
-            EmailDetector(),
-            PhoneDetector(),
-            NameDetector(),
-            CreditCardDetector(),
-        ]
+        # Initialize detectors (emails, phones and credit cards share one regex scan)
+        detectors: list[Detector] = [MultiRegexDetector()]
+
+        if not args.no_names:
+            # Imported lazily: Presidio and spaCy are slow to load
+            from data_sanitizer.detectors.name_detector import NameDetector
+
+            detectors.append(NameDetector())
 
         if args.verbose:
             print("Initialized detectors:")
             for detector in detectors:
-                print(f"  - {detector.__class__.__name__}")
+                if isinstance(detector, MultiRegexDetector):
+                    for component in detector.detectors:
+                        print(f"  - {component.__class__.__name__}")
+                else:
+                    print(f"  - {detector.__class__.__name__}")
             print()
 
         # Initialize replacer (no seed for random fake data)
         replacer = Replacer(seed=None)
 
         # Initialize sanitizer
-        sanitizer = Sanitizer(detectors, replacer)
+        sanitizer = Sanitizer(detectors, replacer, workers=args.workers)
 
         # Convert paths to Path objects
         input_path = Path(args.input_file)
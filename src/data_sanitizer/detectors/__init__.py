@@ -3,6 +3,13 @@
 from data_sanitizer.detectors.base import Detector
 from data_sanitizer.detectors.credit_card_detector import CreditCardDetector
 from data_sanitizer.detectors.email_detector import EmailDetector
+from data_sanitizer.detectors.multi_regex_detector import MultiRegexDetector
 from data_sanitizer.detectors.phone_detector import PhoneDetector
 
-__all__ = ["Detector", "CreditCardDetector", "EmailDetector", "PhoneDetector"]
+__all__ = [
+    "Detector",
+    "CreditCardDetector",
+    "EmailDetector",
+    "MultiRegexDetector",
+    "PhoneDetector",
+]
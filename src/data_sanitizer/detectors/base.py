@@ -6,6 +6,7 @@ PII in text fields.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from data_sanitizer.models import DetectionResult
 
@@ -20,8 +21,21 @@ class Detector(ABC):
     The detector uses a plugin-based architecture to support extensibility,
     allowing new detection strategies (including future LLM-based detection)
     to be added without modifying core logic.
+
+    Detectors that find matches one at a time can override iter_detect()
+    to yield results lazily; the Sanitizer consumes detections through it.
+
+    Detectors with a high per-call overhead (such as NLP models) can set
+    supports_batch to True and override detect_batch(). The Sanitizer then
+    collects all string values up front and analyzes them in a single call.
+
+    Attributes:
+        supports_batch: Whether detect_batch() is more efficient than calling
+            detect() once per value (default: False)
     """
 
+    supports_batch: bool = False
+
     @abstractmethod
     def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
         """Detect PII in the given text.
@@ -62,3 +76,40 @@ class Detector(ABC):
             PIIType.EMAIL
         """
         pass
+
+    def iter_detect(self, text: str, field_name: str = "") -> Iterator[DetectionResult]:
+        """Iterate over the PII detected in the given text.
+
+        The default implementation iterates over the list returned by
+        detect(). Detectors that find matches one at a time override this
+        as a generator so callers can consume results without building an
+        intermediate list.
+
+        Unlike detect(), which returns an empty list for non-string input,
+        iter_detect() requires a str. The Sanitizer only passes string values,
+        so implementations can skip the type check on this hot path.
+
+        Args:
+            text: The text to analyze for PII (must be a str)
+            field_name: Optional name of the field being analyzed
+
+        Yields:
+            DetectionResult objects, as detect() would return them
+        """
+        return iter(self.detect(text, field_name))
+
+    def detect_batch(self, items: list[tuple[str, str]]) -> list[list[DetectionResult]]:
+        """Detect PII in many texts at once.
+
+        The default implementation calls detect() for each item. Detectors
+        that set supports_batch override this to amortize per-call setup
+        across all texts.
+
+        Args:
+            items: List of (text, field_name) pairs to analyze
+
+        Returns:
+            A list with one entry per item, each being the list of
+            DetectionResult objects detect() would return for that item.
+        """
+        return [self.detect(text, field_name) for text, field_name in items]
@@ -6,10 +6,47 @@ of the field name they appear in.
 """
 
 import re
+from collections.abc import Iterator
 
 from data_sanitizer.detectors.base import Detector
 from data_sanitizer.models import DetectionResult, PIIType
 
+# Translation table deleting the separators CARD_PATTERN accepts between digit
+# groups: "-" and every character matched by \s (U+3000 is the highest one)
+_SEPARATOR_TABLE = str.maketrans(
+    "", "", "-" + "".join(chr(code) for code in range(0x3001) if chr(code).isspace())
+)
+
+# Finds the first run of 4 digits; every CARD_PATTERN match starts with one
+_CARD_HINT_SEARCH = re.compile(r"\d{4}").search
+
+# Translation tables mapping ASCII digit bytes to their Luhn contributions:
+# undoubled digits keep their value, doubled digits map to the digit sum of 2*d
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+_DOUBLED_DIGIT_VALUES = bytes.maketrans(
+    b"0123456789", bytes((2 * d) // 10 + (2 * d) % 10 for d in range(10))
+)
+
+# The ASCII subset of the separators in _SEPARATOR_TABLE, for bytes.translate()
+_ASCII_SEPARATORS = b"-" + bytes(code for code in range(128) if chr(code).isspace())
+
+
+def _luhn_total_is_valid(digits: bytes) -> bool:
+    """Check the Luhn checksum of a string of ASCII digit bytes.
+
+    Args:
+        digits: ASCII digits without separators
+
+    Returns:
+        True if the Luhn total is a multiple of 10, False otherwise
+    """
+    # Starting from the rightmost digit, every second digit is kept as-is
+    # and the others are doubled; both halves are summed via lookup tables
+    total = sum(digits[-1::-2].translate(_DIGIT_VALUES)) + sum(
+        digits[-2::-2].translate(_DOUBLED_DIGIT_VALUES)
+    )
+    return total % 10 == 0
+
 
 class CreditCardDetector(Detector):
     """Detector for credit card numbers.
@@ -62,36 +99,70 @@ class CreditCardDetector(Detector):
         if not isinstance(text, str):
             return []
 
-        results = []
+        return list(self.iter_detect(text, field_name))
+
+    def iter_detect(self, text: str, field_name: str = "") -> Iterator[DetectionResult]:
+        """Iterate over the valid credit card numbers in the given text.
+
+        Args:
+            text: The text to analyze for credit card numbers
+            field_name: Optional field name (not used for credit card detection)
+
+        Yields:
+            DetectionResult objects for Luhn-valid cards, ordered by position
+        """
+        # Skip the full pattern for texts without a 4-digit run, and start it
+        # at the first one otherwise
+        hint = _CARD_HINT_SEARCH(text)
+        if hint is None:
+            return
 
         # Find all potential credit card matches in the text
-        for match in self.CARD_PATTERN.finditer(text):
+        for match in self.CARD_PATTERN.finditer(text, hint.start()):
             card_with_separators = match.group(0)
             start_pos = match.start()
             end_pos = match.end()
 
-            # Extract digits only for Luhn validation
-            digits_only = re.sub(r"[\s\-]", "", card_with_separators)
-
-            # Validate length (13-19 digits)
-            if not (13 <= len(digits_only) <= 19):
-                continue
-
-            # Validate using Luhn algorithm
-            if not self._luhn_check(digits_only):
+            # Validate length and Luhn checksum
+            if not self.is_valid(card_with_separators):
                 continue
 
             # Create detection result with high confidence (Luhn validation passed)
-            result = DetectionResult(
+            yield DetectionResult(
                 pii_type=PIIType.CREDIT_CARD,
                 original_value=card_with_separators,
                 confidence=1.0,
                 start_pos=start_pos,
                 end_pos=end_pos,
             )
-            results.append(result)
 
-        return results
+    def is_valid(self, candidate: str) -> bool:
+        """Check whether a regex candidate is a valid credit card number.
+
+        Separators are stripped before validating that the number has 13-19
+        digits and passes the Luhn checksum.
+
+        Args:
+            candidate: Matched text, possibly containing spaces or dashes
+
+        Returns:
+            True if the candidate is a valid credit card number, False otherwise
+        """
+        if candidate.isascii():
+            # Fast path for the common case: strip separators and validate
+            # the digits as bytes, without building intermediate strings
+            digits = candidate.encode("ascii").translate(None, _ASCII_SEPARATORS)
+            return 13 <= len(digits) <= 19 and digits.isdigit() and _luhn_total_is_valid(digits)
+
+        # Extract digits only for Luhn validation
+        digits_only = candidate.translate(_SEPARATOR_TABLE)
+
+        # Validate length (13-19 digits)
+        if not (13 <= len(digits_only) <= 19):
+            return False
+
+        # Validate using Luhn algorithm
+        return self._luhn_check(digits_only)
 
     def _luhn_check(self, card_number: str) -> bool:
         """Validate a credit card number using the Luhn algorithm.
@@ -119,16 +190,8 @@ class CreditCardDetector(Detector):
         if not card_number.isdigit():
             return False
 
-        # Convert to list of integers, reversed for easier processing
-        digits = [int(d) for d in card_number[::-1]]
-
-        # Double every second digit (starting from index 1, which is second from right)
-        for i in range(1, len(digits), 2):
-            digits[i] *= 2
-            # If doubling results in two digits, subtract 9 (equivalent to adding digits)
-            if digits[i] > 9:
-                digits[i] -= 9
+        if not card_number.isascii():
+            # Normalize non-ASCII decimal digits (e.g. Arabic-Indic) to ASCII
+            card_number = "".join(str(int(d)) for d in card_number)
 
-        # Sum all digits and check if divisible by 10
-        total = sum(digits)
-        return total % 10 == 0
+        return _luhn_total_is_valid(card_number.encode("ascii"))
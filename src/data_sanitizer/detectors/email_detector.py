@@ -5,10 +5,14 @@ email addresses regardless of the field name they appear in.
 """
 
 import re
+from collections.abc import Iterator
 
 from data_sanitizer.detectors.base import Detector
 from data_sanitizer.models import DetectionResult, PIIType
 
+# Characters EMAIL_PATTERN accepts in the local part before "@"
+_LOCAL_PART_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-")
+
 
 class EmailDetector(Detector):
     """Detector for email addresses.
@@ -31,7 +35,7 @@ class EmailDetector(Detector):
     # - Local part: alphanumeric, dots, underscores, percent, plus, hyphen
     # - Domain: alphanumeric, dots, hyphens
     # - TLD: 2+ alphabetic characters
-    EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+    EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
 
     def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
         """Detect email addresses in the given text.
@@ -62,22 +66,59 @@ class EmailDetector(Detector):
         if not isinstance(text, str):
             return []
 
-        results = []
+        return list(self.iter_detect(text, field_name))
+
+    @staticmethod
+    def scan_start(text: str) -> int:
+        """Find the earliest position at which an email can start in the text.
+
+        Every match contains "@" and starts within the run of local-part
+        characters right before it, so nothing before the run preceding the
+        first "@" can match. Finding that run with str.find() and a short
+        backwards walk is much cheaper than letting the regex try every
+        earlier position, e.g. in long narrative fields.
+
+        Args:
+            text: The text to be scanned for emails
+
+        Returns:
+            Position to start scanning from, or -1 if the text has no "@"
+        """
+        start = text.find("@")
+        if start < 0:
+            return -1
 
-        # Find all email matches in the text
-        for match in self.EMAIL_PATTERN.finditer(text):
+        while start > 0 and text[start - 1] in _LOCAL_PART_CHARS:
+            start -= 1
+        return start
+
+    def iter_detect(self, text: str, field_name: str = "") -> Iterator[DetectionResult]:
+        """Iterate over the email addresses in the given text.
+
+        Args:
+            text: The text to analyze for email addresses
+            field_name: Optional field name (not used for email detection)
+
+        Yields:
+            DetectionResult objects for each email, ordered by position
+        """
+        # Every email contains "@"; skip the regex scan for texts without one
+        start = self.scan_start(text)
+        if start < 0:
+            return
+
+        # Find all email matches in the text, skipping the prefix that cannot
+        # contain one
+        for match in self.EMAIL_PATTERN.finditer(text, start):
             email = match.group(0)
             start_pos = match.start()
             end_pos = match.end()
 
             # Create detection result with high confidence (regex is deterministic)
-            result = DetectionResult(
+            yield DetectionResult(
                 pii_type=PIIType.EMAIL,
                 original_value=email,
                 confidence=1.0,
                 start_pos=start_pos,
                 end_pos=end_pos,
             )
-            results.append(result)
-
-        return results
@@ -0,0 +1,243 @@
+"""Combined detector for regex-based PII in a single scan.
+
+This module implements a detector that fuses the email, credit card, and
+phone number patterns into one alternation, so each text value is scanned
+once instead of once per regex-based detector.
+"""
+
+import re
+import threading
+from collections.abc import Iterator
+from functools import cache
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
+
+from data_sanitizer.detectors.base import Detector
+from data_sanitizer.detectors.credit_card_detector import CreditCardDetector
+from data_sanitizer.detectors.email_detector import EmailDetector
+from data_sanitizer.detectors.phone_detector import PhoneDetector
+from data_sanitizer.models import DetectionResult, PIIType
+
+# Finds the first digit in a text; cards and phones both require digits
+_DIGIT_SEARCH = re.compile(r"\d").search
+
+# Maps every ASCII character Python's str \s matches to a plain space, since
+# bytes patterns and Hyperscan's \s do not include the \x1c-\x1f separators
+_ASCII_WHITESPACE_TABLE = bytes.maketrans(b"\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f", b" " * 9)
+
+
+def _build_combined_pattern() -> str:
+    """Build the fused pattern with one named group per source pattern.
+
+    Alternatives are ordered email, credit card, then phone formats. Emails
+    contain "@" so they never compete with digit runs, and long digit runs
+    are tried as credit cards before falling back to phone numbers.
+
+    Returns:
+        Alternation of all regex detector patterns
+    """
+    named_patterns = [
+        ("email", EmailDetector.EMAIL_PATTERN.pattern),
+        ("card", CreditCardDetector.CARD_PATTERN.pattern),
+        ("phone", PhoneDetector.PHONE_PATTERN.pattern),
+    ]
+    return "|".join(f"(?P<{name}>{pattern})" for name, pattern in named_patterns)
+
+
+@cache
+def _compile_hyperscan_database() -> "hyperscan.Database":
+    """Compile the detector patterns into a Hyperscan database once per process.
+
+    Returns:
+        Block-mode database reporting at most one match per pattern
+    """
+    patterns = [
+        EmailDetector.EMAIL_PATTERN.pattern,
+        CreditCardDetector.CARD_PATTERN.pattern,
+        PhoneDetector.PHONE_PATTERN.pattern,
+    ]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode("ascii") for pattern in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+    )
+    return database
+
+
+def _stop_scan(*_: object) -> bool:
+    """Hyperscan match handler that stops scanning at the first match."""
+    return True
+
+
+class MultiRegexDetector(Detector):
+    """Detector for emails, credit cards, and phone numbers in one pass.
+
+    Running EmailDetector, CreditCardDetector, and PhoneDetector separately
+    walks every string three times.
+    This detector scans once with a combined pattern and
+    dispatches each match on its named group to the validator of the
+    detector that owns the pattern:
+    - "email": emitted directly (regex match is deterministic)
+    - "card": length and Luhn validation, falling back to phone formats
+    - "phone": 10-15 digit count validation
+
+    Because the scan never returns overlapping matches, a value such as a
+    15-digit Amex number is reported once as a credit card rather than as
+    both a credit card and a phone number.
+
+    NameDetector is not included since it relies on Presidio rather than
+    regular expressions.
+
+    ASCII texts, the common case, are encoded once and scanned with bytes
+    versions of the patterns, which avoid the cost of Unicode matching.
+    Character offsets equal byte offsets for ASCII, so positions and values
+    are taken from the original text.
+
+    If the optional hyperscan package is installed, ASCII texts are first
+    scanned with a SIMD-accelerated Hyperscan database of the same patterns.
+    The regex scan, which reports exact non-overlapping spans, only runs on
+    texts where Hyperscan finds a candidate.
+
+    Attributes:
+        COMBINED_PATTERN: Compiled alternation of all regex detector patterns
+        COMBINED_BYTES_PATTERN: COMBINED_PATTERN compiled for ASCII bytes
+        PHONE_BYTES_PATTERN: PhoneDetector.PHONE_PATTERN compiled for ASCII bytes
+        detectors: The component detectors whose patterns are combined
+    """
+
+    COMBINED_PATTERN = re.compile(_build_combined_pattern())
+    COMBINED_BYTES_PATTERN = re.compile(_build_combined_pattern().encode("ascii"))
+    PHONE_BYTES_PATTERN = re.compile(PhoneDetector.PHONE_PATTERN.pattern.encode("ascii"))
+
+    def __init__(self) -> None:
+        """Initialize the component detectors used for validation."""
+        self.email_detector = EmailDetector()
+        self.credit_card_detector = CreditCardDetector()
+        self.phone_detector = PhoneDetector()
+        self.detectors: list[Detector] = [
+            self.email_detector,
+            self.credit_card_detector,
+            self.phone_detector,
+        ]
+        self._hyperscan_database = _compile_hyperscan_database() if hyperscan is not None else None
+        # Hyperscan scratch space must not be shared between threads
+        self._hyperscan_local = threading.local()
+
+    def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
+        """Detect emails, credit cards, and phone numbers in the given text.
+
+        Args:
+            text: The text to analyze for PII
+            field_name: Optional field name (not used, as regex-based PII is
+                detected regardless of field name)
+
+        Returns:
+            A list of DetectionResult objects ordered by position. Returns an
+            empty list if no PII is found.
+
+        Example:
+            >>> detector = MultiRegexDetector()
+            >>> results = detector.detect("Mail john@example.com or call 555-123-4567")
+            >>> [result.pii_type for result in results]
+            [PIIType.EMAIL, PIIType.PHONE]
+        """
+        if not isinstance(text, str):
+            return []
+
+        return list(self.iter_detect(text, field_name))
+
+    def iter_detect(self, text: str, field_name: str = "") -> Iterator[DetectionResult]:
+        """Iterate over the emails, credit cards, and phone numbers in the text.
+
+        Args:
+            text: The text to analyze for PII
+            field_name: Optional field name (not used for regex-based PII)
+
+        Yields:
+            Non-overlapping DetectionResult objects, ordered by position
+        """
+        # Emails need "@" and cards/phones need a digit; skip the scan otherwise
+        email_start = EmailDetector.scan_start(text)
+        digit = _DIGIT_SEARCH(text)
+        if email_start < 0 and digit is None:
+            return
+
+        # No match can start before the first email candidate or the
+        # character before the first digit (a phone's "+" or "(")
+        pos = len(text) if digit is None else max(digit.start() - 1, 0)
+        if email_start >= 0:
+            pos = min(pos, email_start)
+
+        if text.isascii():
+            # Scan bytes with \x1c-\x1f mapped to spaces so \s matches as on str
+            subject: str | bytes = text.encode("ascii").translate(_ASCII_WHITESPACE_TABLE)
+            if not self._may_contain_pii(subject):
+                return
+            search = self.COMBINED_BYTES_PATTERN.search
+            match_phone = self.PHONE_BYTES_PATTERN.match
+        else:
+            subject = text
+            search = self.COMBINED_PATTERN.search
+            match_phone = PhoneDetector.PHONE_PATTERN.match
+
+        while (match := search(subject, pos)) is not None:
+            kind = match.lastgroup
+            start_pos = match.start()
+            end_pos = match.end()
+            value = text[start_pos:end_pos]
+
+            if kind == "email":
+                pii_type = PIIType.EMAIL
+            elif kind == "card" and self.credit_card_detector.is_valid(value):
+                pii_type = PIIType.CREDIT_CARD
+            else:
+                if kind == "card":
+                    # Not a card, but the same digits may still form a phone number
+                    phone_match = match_phone(subject, start_pos)
+                    end_pos = phone_match.end() if phone_match else start_pos
+                    value = text[start_pos:end_pos]
+
+                # A rejected candidate may still contain a valid value, so
+                # resume scanning right after its start
+                if not self.phone_detector.is_valid(value):
+                    pos = start_pos + 1
+                    continue
+                pii_type = PIIType.PHONE
+
+            yield DetectionResult(
+                pii_type=pii_type,
+                original_value=value,
+                confidence=1.0,
+                start_pos=start_pos,
+                end_pos=end_pos,
+            )
+            pos = end_pos
+
+    def _may_contain_pii(self, data: bytes) -> bool:
+        """Check with Hyperscan whether any detector pattern matches the data.
+
+        Args:
+            data: ASCII text to check, with separators 0x1C-0x1F mapped to spaces
+
+        Returns:
+            False if Hyperscan proves no pattern matches, True otherwise
+            (including when Hyperscan is unavailable)
+        """
+        if self._hyperscan_database is None:
+            return True
+
+        scratch = getattr(self._hyperscan_local, "scratch", None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self._hyperscan_database)
+            self._hyperscan_local.scratch = scratch
+
+        try:
+            self._hyperscan_database.scan(data, match_event_handler=_stop_scan, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
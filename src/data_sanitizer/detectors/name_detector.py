@@ -4,12 +4,38 @@ This module implements name detection using Presidio's PERSON entity recognizer
 to identify full names, first names, and last names in text fields.
 """
 
-from presidio_analyzer import AnalyzerEngine
+import re
+from typing import ClassVar
+
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerResult
 from presidio_analyzer.nlp_engine import NlpEngineProvider
 
 from data_sanitizer.detectors.base import Detector
 from data_sanitizer.models import DetectionResult, PIIType
 
+# Finds the first letter (any script); a value without letters cannot hold a
+# name, so dates, amounts, and numeric IDs skip the NLP pipeline
+_LETTER_SEARCH = re.compile(r"[^\W\d_]").search
+
+# Normalized field names (lowercase, without "_" and "-") that determine the
+# name type regardless of the detected text
+_FIELD_HINTS: dict[str, PIIType] = {
+    # Full name hints
+    "fullname": PIIType.FULL_NAME,
+    "name": PIIType.FULL_NAME,
+    # First name hints
+    "firstname": PIIType.FIRST_NAME,
+    "fname": PIIType.FIRST_NAME,
+    "givenname": PIIType.FIRST_NAME,
+    "first": PIIType.FIRST_NAME,
+    # Last name hints
+    "lastname": PIIType.LAST_NAME,
+    "lname": PIIType.LAST_NAME,
+    "surname": PIIType.LAST_NAME,
+    "familyname": PIIType.LAST_NAME,
+    "last": PIIType.LAST_NAME,
+}
+
 
 class NameDetector(Detector):
     """Detector for person names.
@@ -26,18 +52,33 @@ class NameDetector(Detector):
     - "last_name", "lastname", "lname", "surname" -> LAST_NAME
     - "name", "full_name", "fullname" -> context-dependent
 
+    Loading the spaCy model behind Presidio is expensive, so the analyzer is
+    created once per process and shared by all NameDetector instances.
+
     Attributes:
         analyzer: Presidio AnalyzerEngine for PII detection
+        _shared_analyzer: Class-level analyzer shared across instances
+            (None until the first NameDetector is created)
     """
 
+    supports_batch = True
+
+    # Number of texts handed to spaCy's nlp.pipe() at a time in detect_batch()
+    BATCH_SIZE = 256
+
+    _shared_analyzer: ClassVar[AnalyzerEngine | None] = None
+
     def __init__(self) -> None:
-        """Initialize the name detector with Presidio analyzer."""
-        # Create NLP engine provider with spaCy
-        provider = NlpEngineProvider()
-        nlp_engine = provider.create_engine()
+        """Initialize the name detector with the shared Presidio analyzer."""
+        if NameDetector._shared_analyzer is None:
+            # Create NLP engine provider with spaCy
+            provider = NlpEngineProvider()
+            nlp_engine = provider.create_engine()
+
+            # Create analyzer with default recognizers
+            NameDetector._shared_analyzer = AnalyzerEngine(nlp_engine=nlp_engine)
 
-        # Create analyzer with default recognizers
-        self.analyzer = AnalyzerEngine(nlp_engine=nlp_engine)
+        self.analyzer = NameDetector._shared_analyzer
 
     def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
         """Detect person names in the given text.
@@ -46,6 +87,8 @@ class NameDetector(Detector):
         as full names, first names, or last names based on word count and field
         name hints.
 
+        Texts without any letter are rejected before running the analyzer.
+
         Args:
             text: The text to analyze for person names
             field_name: Optional field name that provides hints about name type
@@ -62,14 +105,66 @@ class NameDetector(Detector):
             >>> results[0].pii_type
             PIIType.FULL_NAME
         """
-        if not isinstance(text, str) or not text.strip():
+        if not isinstance(text, str) or _LETTER_SEARCH(text) is None:
             return []
 
-        results = []
-
         # Analyze text with Presidio
         analyzer_results = self.analyzer.analyze(text=text, language="en", entities=["PERSON"])
 
+        return self._to_detections(text, field_name, analyzer_results)
+
+    def detect_batch(self, items: list[tuple[str, str]]) -> list[list[DetectionResult]]:
+        """Detect person names in many texts with a single batched NLP pass.
+
+        Texts are fed through spaCy's nlp.pipe() via Presidio's
+        BatchAnalyzerEngine, which amortizes tokenizer and pipeline setup
+        across all texts. This is much faster than calling detect() for each
+        of many short values.
+
+        Args:
+            items: List of (text, field_name) pairs to analyze
+
+        Returns:
+            A list with one entry per item, each being the list of
+            DetectionResult objects detect() would return for that item.
+        """
+        batch_results: list[list[DetectionResult]] = [[] for _ in items]
+
+        # Skip values without letters, which detect() rejects without running
+        # the analyzer
+        indices = [index for index, (text, _) in enumerate(items) if _LETTER_SEARCH(text)]
+        if not indices:
+            return batch_results
+
+        batch_engine = BatchAnalyzerEngine(analyzer_engine=self.analyzer)
+        analyzer_results = batch_engine.analyze_iterator(
+            [items[index][0] for index in indices],
+            language="en",
+            batch_size=self.BATCH_SIZE,
+            entities=["PERSON"],
+        )
+
+        for index, results in zip(indices, analyzer_results, strict=True):
+            text, field_name = items[index]
+            batch_results[index] = self._to_detections(text, field_name, results)
+
+        return batch_results
+
+    def _to_detections(
+        self, text: str, field_name: str, analyzer_results: list[RecognizerResult]
+    ) -> list[DetectionResult]:
+        """Convert Presidio PERSON results into detection results.
+
+        Args:
+            text: The analyzed text
+            field_name: The field name that may contain name type hints
+            analyzer_results: Presidio results for the text
+
+        Returns:
+            A list of DetectionResult objects, one for each detected name
+        """
+        results = []
+
         # Process each detected person entity
         for result in analyzer_results:
             name_text = text[result.start : result.end]
@@ -100,29 +195,15 @@ class NameDetector(Detector):
         Returns:
             PIIType indicating FULL_NAME, FIRST_NAME, or LAST_NAME
         """
-        # Normalize field name for comparison
+        # Normalize field name and check for name type hints
         field_lower = field_name.lower().replace("_", "").replace("-", "")
+        hinted_type = _FIELD_HINTS.get(field_lower)
+        if hinted_type is not None:
+            return hinted_type
 
-        # Check for full name hints
-        full_name_hints = ["fullname", "name"]
-        if any(hint == field_lower for hint in full_name_hints):
-            return PIIType.FULL_NAME
-
-        # Check for first name hints
-        first_name_hints = ["firstname", "fname", "givenname", "first"]
-        if any(hint == field_lower for hint in first_name_hints):
-            return PIIType.FIRST_NAME
-
-        # Check for last name hints
-        last_name_hints = ["lastname", "lname", "surname", "familyname", "last"]
-        if any(hint == field_lower for hint in last_name_hints):
-            return PIIType.LAST_NAME
-
-        # Count words in the name (split by whitespace)
-        words = name_text.split()
-
-        # If 2+ words, it's a full name
-        if len(words) >= 2:
+        # If 2+ words (split by whitespace), it's a full name. Splitting at
+        # most once is enough to tell one word from several.
+        if len(name_text.split(maxsplit=1)) >= 2:
             return PIIType.FULL_NAME
 
         # Single word with no field hints - default to FIRST_NAME
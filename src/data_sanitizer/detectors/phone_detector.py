@@ -5,10 +5,17 @@ phone numbers in various formats regardless of the field name they appear in.
 """
 
 import re
+from collections.abc import Iterator
 
 from data_sanitizer.detectors.base import Detector
 from data_sanitizer.models import DetectionResult, PIIType
 
+# Finds the first digit in a text; texts without digits cannot contain phones
+_DIGIT_SEARCH = re.compile(r"\d").search
+
+# Every ASCII byte except the digits, deleted with bytes.translate() to count digits
+_ASCII_NON_DIGITS = bytes(code for code in range(128) if not chr(code).isdigit())
+
 
 class PhoneDetector(Detector):
     """Detector for phone numbers.
@@ -28,28 +35,29 @@ class PhoneDetector(Detector):
     The detector validates that the number contains 10-15 digits total.
 
     Attributes:
-        PHONE_PATTERNS: List of compiled regex patterns for phone detection
+        PHONE_PATTERN: Compiled regex pattern combining all supported formats
     """
 
-    # Regex patterns for various phone number formats
-    # Pattern 1: International format with dashes (+1-234-567-8900)
-    # Pattern 2: Parentheses format ((234) 567-8900)
-    # Pattern 3: Dashes format (234-567-8900)
-    # Pattern 4: Plain digits (2345678900)
-    # Pattern 5: With spaces (234 567 8900)
-    PHONE_PATTERNS = [
-        re.compile(r"\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,4}"),
-        re.compile(r"\(\d{3}\)\s?\d{3}[-.\s]?\d{4}"),
-        re.compile(r"\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b"),
-        re.compile(r"\b\d{10,15}\b"),
-    ]
+    # Regex alternatives for various phone number formats
+    # Alternative 1: International format (+1-234-567-8900, +1 234 567 8900)
+    # Alternative 2: Parentheses format ((234) 567-8900)
+    # Alternative 3: Dashes, dots or spaces (234-567-8900, 234 567 8900)
+    # Alternative 4: Plain digits (2345678900)
+    # The formats are fused into one alternation so the text is scanned once;
+    # finditer never returns overlapping matches, so no deduplication is needed
+    PHONE_PATTERN = re.compile(
+        r"(?:\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,4})"
+        r"|(?:\(\d{3}\)\s?\d{3}[-.\s]?\d{4})"
+        r"|(?:\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b)"
+        r"|(?:\b\d{10,15}\b)"
+    )
 
     def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
         """Detect phone numbers in the given text.
 
-        This method scans the text for phone numbers using multiple regex patterns
-        to support various formats. It validates that detected numbers have 10-15
-        digits and returns all matches with their positions.
+        This method scans the text once with a pattern covering all supported
+        formats. It validates that detected numbers have 10-15 digits and
+        returns all matches with their positions.
 
         Args:
             text: The text to analyze for phone numbers
@@ -73,50 +81,59 @@ class PhoneDetector(Detector):
         if not isinstance(text, str):
             return []
 
-        # Collect all potential matches from all patterns
-        all_matches = []
-        for pattern in self.PHONE_PATTERNS:
-            for match in pattern.finditer(text):
-                phone = match.group(0)
-                start_pos = match.start()
-                end_pos = match.end()
-
-                # Validate digit count (10-15 digits)
-                digit_count = sum(c.isdigit() for c in phone)
-                if digit_count < 10 or digit_count > 15:
-                    continue
-
-                all_matches.append((start_pos, end_pos, phone))
-
-        # Remove overlapping matches, keeping the longest ones
-        # Sort by start position, then by length (descending)
-        all_matches.sort(key=lambda x: (x[0], -(x[1] - x[0])))
-
-        results = []
-        used_ranges = []
-
-        for start_pos, end_pos, phone in all_matches:
-            # Check if this match overlaps with any already selected match
-            overlaps = False
-            for used_start, used_end in used_ranges:
-                # Check for overlap
-                if not (end_pos <= used_start or start_pos >= used_end):
-                    overlaps = True
-                    break
-
-            if not overlaps:
-                # Add this match
-                used_ranges.append((start_pos, end_pos))
-                result = DetectionResult(
-                    pii_type=PIIType.PHONE,
-                    original_value=phone,
-                    confidence=1.0,
-                    start_pos=start_pos,
-                    end_pos=end_pos,
-                )
-                results.append(result)
-
-        # Sort results by start position for consistent ordering
-        results.sort(key=lambda x: x.start_pos)
-
-        return results
+        return list(self.iter_detect(text, field_name))
+
+    def iter_detect(self, text: str, field_name: str = "") -> Iterator[DetectionResult]:
+        """Iterate over the phone numbers in the given text.
+
+        Args:
+            text: The text to analyze for phone numbers
+            field_name: Optional field name (not used for phone detection)
+
+        Yields:
+            DetectionResult objects for valid phone numbers, ordered by position
+        """
+        # Skip the pattern scans for texts without any digit
+        digit = _DIGIT_SEARCH(text)
+        if digit is None:
+            return
+
+        search = self.PHONE_PATTERN.search
+
+        # Scan left to right; matches never overlap, so no deduplication is
+        # needed. Every format starts with a digit or a "+" or "(" right
+        # before one, so the scan can start just before the first digit.
+        pos = max(digit.start() - 1, 0)
+        while (match := search(text, pos)) is not None:
+            phone = match.group(0)
+
+            # Validate digit count (10-15 digits). A rejected candidate may
+            # still contain a valid number, so resume right after its start.
+            if not self.is_valid(phone):
+                pos = match.start() + 1
+                continue
+
+            yield DetectionResult(
+                pii_type=PIIType.PHONE,
+                original_value=phone,
+                confidence=1.0,
+                start_pos=match.start(),
+                end_pos=match.end(),
+            )
+            pos = match.end()
+
+    def is_valid(self, candidate: str) -> bool:
+        """Check whether a regex candidate has a plausible phone digit count.
+
+        Args:
+            candidate: Matched phone number text, including any separators
+
+        Returns:
+            True if the candidate contains 10-15 digits, False otherwise
+        """
+        if candidate.isascii():
+            # Delete non-digits in a single C pass instead of testing each char
+            digit_count = len(candidate.encode("ascii").translate(None, _ASCII_NON_DIGITS))
+        else:
+            digit_count = sum(c.isdigit() for c in candidate)
+        return 10 <= digit_count <= 15
@@ -28,10 +28,13 @@ class PIIType(Enum):
     CREDIT_CARD = "credit_card"
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionResult:
     """Result of PII detection in a text field.
 
+    Detectors create one instance per match, so the class uses __slots__ to
+    avoid a per-instance __dict__.
+
     Attributes:
         pii_type: The type of PII detected
         original_value: The original PII value found in the text
@@ -47,7 +50,7 @@ class DetectionResult:
     end_pos: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SanitizationResult:
     """Result of a sanitization operation.
 
@@ -66,7 +69,7 @@ class SanitizationResult:
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SanitizerConfig:
     """Configuration for the sanitizer.
 
@@ -7,11 +7,48 @@ fake value throughout the sanitization process.
 """
 
 import re
+from collections import defaultdict
+from collections.abc import Callable
+from enum import IntEnum
 
 from faker import Faker
 
 from data_sanitizer.models import DetectionResult, PIIType
 
+# Matches every non-digit character, for stripping phone number formatting
+_NON_DIGIT = re.compile(r"\D")
+
+
+class _PhoneFormat(IntEnum):
+    """Phone number layouts that replacements preserve."""
+
+    OTHER = 0
+    PARENTHESES = 1
+    DASHED = 2
+    INTERNATIONAL = 3
+    DIGITS_ONLY = 4
+
+
+def _classify_phone_format(original: str) -> _PhoneFormat:
+    """Classify the layout of an original phone number.
+
+    Args:
+        original: Original phone number
+
+    Returns:
+        The first matching format, checked in order: parentheses,
+        dashes without a country code, country code, digits only
+    """
+    if "(" in original and ")" in original:
+        return _PhoneFormat.PARENTHESES
+    if "+" in original:
+        return _PhoneFormat.INTERNATIONAL
+    if "-" in original:
+        return _PhoneFormat.DASHED
+    if original.isdigit():
+        return _PhoneFormat.DIGITS_ONLY
+    return _PhoneFormat.OTHER
+
 
 class Replacer:
     """Generates consistent fake data for detected PII.
@@ -23,7 +60,8 @@ class Replacer:
 
     Attributes:
         _faker: Faker instance for generating fake data
-        _cache: Consistency cache mapping (original_value, pii_type) to fake value
+        _cache: Consistency cache mapping pii_type, then original_value, to fake value
+        _generators: Fake value generator for each PII type
         _name_pairs: Cache for cross-field name consistency (first/last name pairs)
     """
 
@@ -39,8 +77,28 @@ class Replacer:
             Faker.seed(seed)
         self._faker = Faker()
 
-        # Consistency cache: (original_value, pii_type) -> fake_value
-        self._cache: dict[tuple[str, PIIType], str] = {}
+        # Faker resolves providers through a proxy __getattr__ on every
+        # access, so bind the generator methods once
+        self._fake_email = self._faker.email
+        self._fake_phone_number = self._faker.phone_number
+        self._fake_name = self._faker.name
+        self._fake_first_name = self._faker.first_name
+        self._fake_last_name = self._faker.last_name
+        self._fake_credit_card_number = self._faker.credit_card_number
+
+        # Consistency cache: pii_type -> {original_value -> fake_value}
+        # (two plain lookups avoid building and hashing a tuple key per call)
+        self._cache: defaultdict[PIIType, dict[str, str]] = defaultdict(dict)
+
+        # Generator per PII type, each taking the original value
+        self._generators: dict[PIIType, Callable[[str], str]] = {
+            PIIType.EMAIL: lambda _original: self._generate_email(),
+            PIIType.PHONE: self._generate_phone,
+            PIIType.FULL_NAME: self._generate_full_name,
+            PIIType.FIRST_NAME: self._generate_first_name,
+            PIIType.LAST_NAME: self._generate_last_name,
+            PIIType.CREDIT_CARD: lambda _original: self._generate_credit_card(),
+        }
 
         # Cross-field name consistency: track first/last name pairs
         # Maps original first names to fake first names
@@ -70,7 +128,12 @@ class Replacer:
             >>> fake_email == fake_email2
             True
         """
-        return self.get_or_create_replacement(detection.original_value, detection.pii_type)
+        # Cache hits skip the generator dispatch entirely
+        bucket = self._cache[detection.pii_type]
+        cached = bucket.get(detection.original_value)
+        if cached is not None:
+            return cached
+        return self._generate_and_cache(detection.original_value, detection.pii_type, bucket)
 
     def get_or_create_replacement(self, original: str, pii_type: PIIType) -> str:
         """Get existing replacement or create new one for consistency.
@@ -86,31 +149,35 @@ class Replacer:
         Returns:
             Consistent fake replacement value
         """
-        cache_key = (original, pii_type)
+        bucket = self._cache[pii_type]
 
         # Check cache first
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = bucket.get(original)
+        if cached is not None:
+            return cached
+        return self._generate_and_cache(original, pii_type, bucket)
 
+    def _generate_and_cache(self, original: str, pii_type: PIIType, bucket: dict[str, str]) -> str:
+        """Generate a new fake value on a cache miss and store it in the bucket.
+
+        Args:
+            original: Original PII value
+            pii_type: Type of PII
+            bucket: The consistency cache entry for pii_type
+
+        Returns:
+            Newly generated fake replacement value
+        """
         # Generate new fake value based on PII type
-        if pii_type == PIIType.EMAIL:
-            fake_value = self._generate_email()
-        elif pii_type == PIIType.PHONE:
-            fake_value = self._generate_phone(original)
-        elif pii_type == PIIType.FULL_NAME:
-            fake_value = self._generate_full_name(original)
-        elif pii_type == PIIType.FIRST_NAME:
-            fake_value = self._generate_first_name(original)
-        elif pii_type == PIIType.LAST_NAME:
-            fake_value = self._generate_last_name(original)
-        elif pii_type == PIIType.CREDIT_CARD:
-            fake_value = self._generate_credit_card()
+        generator = self._generators.get(pii_type)
+        if generator is not None:
+            fake_value = generator(original)
         else:
             # Fallback for unknown types
             fake_value = "[REDACTED]"
 
         # Cache and return
-        self._cache[cache_key] = fake_value
+        bucket[original] = fake_value
         return fake_value
 
     def _generate_email(self) -> str:
@@ -119,7 +186,7 @@ class Replacer:
         Returns:
             Fake email in format local@domain.tld
         """
-        return self._faker.email()
+        return self._fake_email()
 
     def _generate_phone(self, original: str) -> str:
         """Generate a fake phone number with format preservation.
@@ -135,29 +202,30 @@ class Replacer:
             Fake phone number with preserved format
         """
         # Generate a base fake phone number
-        fake_phone = self._faker.phone_number()
-        digits = re.sub(r"\D", "", fake_phone)
+        fake_phone = self._fake_phone_number()
+        digits = _NON_DIGIT.sub("", fake_phone)
 
         # Ensure we have enough digits
         if len(digits) < 10:
             # Generate more digits if needed
-            fake_phone = self._faker.phone_number()
-            digits = re.sub(r"\D", "", fake_phone)
+            fake_phone = self._fake_phone_number()
+            digits = _NON_DIGIT.sub("", fake_phone)
 
         # Try to preserve the format of the original
-        if "(" in original and ")" in original:
+        phone_format = _classify_phone_format(original)
+        if phone_format == _PhoneFormat.PARENTHESES:
             # Format: (234) 567-8900
             if len(digits) >= 10:
                 return f"({digits[0:3]}) {digits[3:6]}-{digits[6:10]}"
-        elif "-" in original and "+" not in original:
+        elif phone_format == _PhoneFormat.DASHED:
             # Format: 234-567-8900
             if len(digits) >= 10:
                 return f"{digits[0:3]}-{digits[3:6]}-{digits[6:10]}"
-        elif "+" in original:
+        elif phone_format == _PhoneFormat.INTERNATIONAL:
             # Format: +1-234-567-8900 or similar international format
             # Keep the original format from Faker
             return fake_phone
-        elif original.isdigit():
+        elif phone_format == _PhoneFormat.DIGITS_ONLY:
             # Format: 2345678900 (no separators)
             return digits[: len(original)]
 
@@ -186,42 +254,18 @@ class Replacer:
             first_normalized = words[0].lower()
             last_normalized = words[-1].lower()  # Use last word as last name
 
-            # Check if we have existing mappings for both parts
-            if first_normalized in self._first_name_map and last_normalized in self._last_name_map:
-                # Construct full name from existing mappings
-                fake_first = self._first_name_map[first_normalized]
-                fake_last = self._last_name_map[last_normalized]
-                fake_name = f"{fake_first} {fake_last}"
-                return self._preserve_case(original, fake_name)
-
-            # If we have a first name mapping but not last, create the last name mapping
-            has_first = first_normalized in self._first_name_map
-            has_last = last_normalized in self._last_name_map
-            if has_first and not has_last:
-                fake_first = self._first_name_map[first_normalized]
-                self._last_name_map[last_normalized] = self._faker.last_name()
-                fake_last = self._last_name_map[last_normalized]
-                fake_name = f"{fake_first} {fake_last}"
-                return self._preserve_case(original, fake_name)
-
-            # If we have a last name mapping but not first, create the first name mapping
-            if has_last and not has_first:
-                self._first_name_map[first_normalized] = self._faker.first_name()
-                fake_first = self._first_name_map[first_normalized]
-                fake_last = self._last_name_map[last_normalized]
-                fake_name = f"{fake_first} {fake_last}"
-                return self._preserve_case(original, fake_name)
-
-            # Neither part has been seen before - create both mappings
-            self._first_name_map[first_normalized] = self._faker.first_name()
-            self._last_name_map[last_normalized] = self._faker.last_name()
-            fake_first = self._first_name_map[first_normalized]
-            fake_last = self._last_name_map[last_normalized]
+            # Reuse existing mappings for either part, creating missing ones
+            fake_first = self._first_name_map.get(first_normalized)
+            if fake_first is None:
+                fake_first = self._first_name_map[first_normalized] = self._fake_first_name()
+            fake_last = self._last_name_map.get(last_normalized)
+            if fake_last is None:
+                fake_last = self._last_name_map[last_normalized] = self._fake_last_name()
             fake_name = f"{fake_first} {fake_last}"
             return self._preserve_case(original, fake_name)
 
         # Single word name - just generate a full name
-        fake_name = self._faker.name()
+        fake_name = self._fake_name()
         return self._preserve_case(original, fake_name)
 
     def _generate_first_name(self, original: str) -> str:
@@ -240,11 +284,10 @@ class Replacer:
         # Normalize for lookup (case-insensitive)
         normalized = original.lower()
 
-        # Check if we've seen this first name before
-        if normalized not in self._first_name_map:
-            self._first_name_map[normalized] = self._faker.first_name()
-
-        fake_name = self._first_name_map[normalized]
+        # Reuse the mapping if we've seen this first name before
+        fake_name = self._first_name_map.get(normalized)
+        if fake_name is None:
+            fake_name = self._first_name_map[normalized] = self._fake_first_name()
         return self._preserve_case(original, fake_name)
 
     def _generate_last_name(self, original: str) -> str:
@@ -263,11 +306,10 @@ class Replacer:
         # Normalize for lookup (case-insensitive)
         normalized = original.lower()
 
-        # Check if we've seen this last name before
-        if normalized not in self._last_name_map:
-            self._last_name_map[normalized] = self._faker.last_name()
-
-        fake_name = self._last_name_map[normalized]
+        # Reuse the mapping if we've seen this last name before
+        fake_name = self._last_name_map.get(normalized)
+        if fake_name is None:
+            fake_name = self._last_name_map[normalized] = self._fake_last_name()
         return self._preserve_case(original, fake_name)
 
     def _generate_credit_card(self) -> str:
@@ -278,7 +320,7 @@ class Replacer:
         Returns:
             Fake credit card number
         """
-        return self._faker.credit_card_number()
+        return self._fake_credit_card_number()
 
     def _preserve_case(self, original: str, fake: str) -> str:
         """Preserve the case pattern of the original string in the fake string.
@@ -5,9 +5,26 @@ sanitization workflow: reading JSON files, detecting PII, replacing it
 with fake data, and writing sanitized output.
 """
 
+import io
 import json
+import os
+import re
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+import ijson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 from data_sanitizer.detectors.base import Detector
 from data_sanitizer.exceptions import (
@@ -15,9 +32,73 @@ from data_sanitizer.exceptions import (
     InvalidOutputPathError,
     JSONParseError,
 )
-from data_sanitizer.models import SanitizationResult
+from data_sanitizer.models import DetectionResult, SanitizationResult
 from data_sanitizer.replacer import Replacer
 
+# Digit runs long enough to hold an integer outside the 64-bit range, which
+# orjson would silently parse as a float
+_LONG_NUMBER_SEARCH = re.compile(rb"\d{19}").search
+
+# Sort key for ordering detections by position (C-level attribute access)
+_START_POS = attrgetter("start_pos")
+
+# Matches a document whose first token opens an array, which can be streamed
+_ARRAY_START = re.compile(rb"[ \t\n\r]*\[").match
+
+# JSON scalar types that never contain PII and are returned unchanged
+_UNCHANGED_TYPES = frozenset({int, float, bool, type(None)})
+
+# Detectors constructed once per worker process by _init_detection_worker(),
+# and the indices of the detectors to run for fields with a detector subset
+_worker_detectors: list[Detector] = []
+_worker_field_detectors: dict[str, frozenset[int]] = {}
+
+
+def _init_detection_worker(
+    detector_classes: list[type[Detector]],
+    field_detector_indices: dict[str, frozenset[int]] | None = None,
+) -> None:
+    """Construct the detectors used by a detection worker process.
+
+    Args:
+        detector_classes: Detector classes to instantiate (without arguments)
+        field_detector_indices: Indices into detector_classes of the detectors
+            to run for each field name that has a detector subset
+    """
+    global _worker_detectors, _worker_field_detectors
+    _worker_detectors = [detector_class() for detector_class in detector_classes]
+    _worker_field_detectors = field_detector_indices or {}
+
+
+def _detect_chunk(items: list[tuple[str, str]]) -> list[list[DetectionResult]]:
+    """Run all worker detectors over a chunk of (text, field_name) pairs.
+
+    Args:
+        items: Chunk of (text, field_name) pairs to analyze
+
+    Returns:
+        Detections for each pair, in detector order
+    """
+    detections: list[list[DetectionResult]] = [[] for _ in items]
+    for index, detector in enumerate(_worker_detectors):
+        targets = detections
+        detector_items = items
+        if _worker_field_detectors:
+            # Only pass the items whose field runs this detector (fields
+            # without a subset run every detector)
+            positions = [
+                position
+                for position, (_, field_name) in enumerate(items)
+                if index in _worker_field_detectors.get(field_name, (index,))
+            ]
+            targets = [detections[position] for position in positions]
+            detector_items = [items[position] for position in positions]
+        for item_detections, results in zip(
+            targets, detector.detect_batch(detector_items), strict=True
+        ):
+            item_detections.extend(results)
+    return detections
+
 
 class Sanitizer:
     """Main orchestrator for PII detection and replacement.
@@ -34,9 +115,44 @@ class Sanitizer:
         _replacer: Replacer instance for generating fake data
         _pii_fields_detected: Counter for fields containing PII
         _pii_replacements_made: Counter for PII values replaced
+        _workers: Number of processes used for detection
+        _batch_detections: Precomputed detections keyed by (text, field_name),
+            filled by sanitize_records()
+        _prefetched_detectors: Detectors whose results are in _batch_detections
+        _stdlib_json_required: Whether the last file read needed the stdlib
+            json parser (e.g. for NaN or big integers), so the output must be
+            written with it too
+        _executor: Detection process pool shared by all chunks of a
+            sanitize_file() call, if workers > 1
+        _skip_fields: Field names whose string values are never scanned
+        _field_detectors: Detector subsets for specific field names
+        _string_cache: LRU cache mapping (text, field_name) to the sanitized
+            text and the number of replacements it took
+
+    Note:
+        PARALLEL_CHUNK_SIZE is the number of unique strings sent to a worker
+        process at a time. Detection only runs in parallel when there is more
+        than one chunk of work.
+
+        STREAM_CHUNK_SIZE is the number of records sanitize_file() holds in
+        memory at a time while streaming a JSON array.
+
+        STRING_CACHE_SIZE is the number of recently sanitized strings kept,
+        so values repeated across records are only scanned once.
     """
 
-    def __init__(self, detectors: list[Detector], replacer: Replacer) -> None:
+    PARALLEL_CHUNK_SIZE = 512
+    STREAM_CHUNK_SIZE = 4096
+    STRING_CACHE_SIZE = 8192
+
+    def __init__(
+        self,
+        detectors: list[Detector],
+        replacer: Replacer,
+        workers: int = 1,
+        skip_fields: Iterable[str] = (),
+        field_detectors: dict[str, list[Detector]] | None = None,
+    ) -> None:
         """Initialize sanitizer with detection and replacement strategies.
 
         Args:
@@ -46,6 +162,20 @@ class Sanitizer:
             replacer: Replacer instance for generating consistent fake data.
                 The replacer maintains a consistency cache to ensure identical
                 PII values are always replaced with the same fake value.
+            workers: Number of processes to run detection in. Workers build
+                their own detectors from the detector classes, so each class
+                must be constructible without arguments when workers > 1.
+                Use 0 for one worker per CPU core. Replacement always happens
+                in the calling process to keep fake values consistent.
+            skip_fields: Field names known not to contain PII (e.g. "id",
+                "status"). String values directly under these fields are
+                left unchanged without running any detector.
+            field_detectors: Optional mapping from field name to the subset
+                of detectors to run on that field's strings. Fields not in
+                the mapping use all detectors.
+
+        Raises:
+            ValueError: If field_detectors refers to a detector not in detectors
 
         Example:
             >>> detectors = [EmailDetector(), PhoneDetector(), NameDetector()]
@@ -56,6 +186,22 @@ class Sanitizer:
         self._replacer = replacer
         self._pii_fields_detected = 0
         self._pii_replacements_made = 0
+        self._workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self._batch_detections: dict[tuple[str, str], list[DetectionResult]] = {}
+        self._prefetched_detectors: list[Detector] = []
+        self._stdlib_json_required = False
+        self._executor: ProcessPoolExecutor | None = None
+        self._skip_fields = frozenset(skip_fields)
+        self._field_detectors = dict(field_detectors or {})
+        self._string_cache: OrderedDict[tuple[str, str], tuple[str, int]] = OrderedDict()
+        for field_name, subset in self._field_detectors.items():
+            if any(detector not in detectors for detector in subset):
+                raise ValueError(f"Detectors for field '{field_name}' must be in detectors")
+        self._value_handlers: dict[type, Callable[[Any, str], Any]] = {
+            str: self._sanitize_string,
+            dict: self._sanitize_dict,
+            list: self._sanitize_list,
+        }
 
     def sanitize_file(self, input_path: Path, output_path: Path) -> SanitizationResult:
         """Sanitize a JSON file by detecting and replacing PII.
@@ -66,6 +212,12 @@ class Sanitizer:
         3. Write the sanitized data to the output file
         4. Return statistics about the operation
 
+        JSON arrays are streamed: records are parsed, sanitized, and written
+        in chunks, so memory use stays flat regardless of the input size.
+        Inputs the streaming parser cannot handle (invalid JSON, NaN, very
+        large integers) are loaded whole, which also reports the exact
+        position of any parse error.
+
         Args:
             input_path: Path to input JSON file containing records to sanitize
             output_path: Path where sanitized JSON output will be written.
@@ -96,43 +248,306 @@ class Sanitizer:
         self._pii_fields_detected = 0
         self._pii_replacements_made = 0
 
+        # Keep one detection process pool alive across all streamed chunks,
+        # unless sanitize_files() already provides one for all files
+        with self._shared_detection_pool():
+            try:
+                # Stream the input file record by record
+                records_processed = self._sanitize_json_stream(input_path, output_path)
+
+                if records_processed is None:
+                    # Discard partial statistics from an aborted stream
+                    self._pii_fields_detected = 0
+                    self._pii_replacements_made = 0
+
+                    # Read input file
+                    records = self._read_json_file(input_path)
+
+                    # Sanitize records
+                    sanitized_records = self.sanitize_records(records)
+
+                    # Write output file
+                    self._write_json_file(output_path, sanitized_records)
+                    records_processed = len(records)
+
+                # Return success result
+                return SanitizationResult(
+                    success=True,
+                    records_processed=records_processed,
+                    pii_fields_detected=self._pii_fields_detected,
+                    pii_replacements_made=self._pii_replacements_made,
+                    error_message=None,
+                )
+
+            except (FileNotFoundError, JSONParseError, InvalidOutputPathError) as e:
+                # Return failure result with error message
+                return self._failed_result(str(e))
+            except Exception as e:
+                # Catch unexpected errors and return user-friendly message
+                return self._failed_result(f"Unexpected error during sanitization: {str(e)}")
+
+    def sanitize_bytes(self, data: bytes) -> tuple[SanitizationResult, bytes | None]:
+        """Sanitize a JSON document held in memory.
+
+        Works like sanitize_file() without touching the filesystem, for
+        callers that already have the document as bytes (e.g. an upload).
+        The output uses the same layout as sanitize_file(). JSON arrays are
+        streamed record by record, so the parsed document is never held in
+        memory as a whole. With workers > 1, all chunks share one detection
+        process pool.
+
+        Args:
+            data: UTF-8 encoded JSON array of records
+
+        Returns:
+            Tuple containing:
+            - SanitizationResult with statistics and status
+            - Sanitized JSON document as bytes (None if sanitization failed)
+
+        Example:
+            >>> result, content = sanitizer.sanitize_bytes(b'[{"name": "John Doe"}]')
+            >>> result.records_processed
+            1
+        """
+        # Reset counters for this operation
+        self._pii_fields_detected = 0
+        self._pii_replacements_made = 0
+
+        # Keep one detection process pool alive across all streamed chunks
+        with self._shared_detection_pool():
+            try:
+                if _ARRAY_START(data):
+                    output = io.BytesIO()
+                    try:
+                        records_processed = self._stream_records(io.BytesIO(data), output)
+                    except ijson.JSONError:
+                        # Parse the whole document below, which reports the
+                        # position of any error
+                        self._pii_fields_detected = 0
+                        self._pii_replacements_made = 0
+                    else:
+                        result = SanitizationResult(
+                            success=True,
+                            records_processed=records_processed,
+                            pii_fields_detected=self._pii_fields_detected,
+                            pii_replacements_made=self._pii_replacements_made,
+                            error_message=None,
+                        )
+                        return result, output.getvalue()
+
+                try:
+                    records = self._parse_json(data)
+                except json.JSONDecodeError as e:
+                    raise JSONParseError(f"Invalid JSON: {e.msg}", line=e.lineno, column=e.colno)
+
+                # Ensure data is a list
+                if not isinstance(records, list):
+                    raise JSONParseError("JSON root must be an array", line=1, column=1)
+
+                content = self._serialize_json(self.sanitize_records(records))
+                result = SanitizationResult(
+                    success=True,
+                    records_processed=len(records),
+                    pii_fields_detected=self._pii_fields_detected,
+                    pii_replacements_made=self._pii_replacements_made,
+                    error_message=None,
+                )
+                return result, content
+
+            except JSONParseError as e:
+                return self._failed_result(str(e)), None
+            except Exception as e:
+                # Catch unexpected errors and return user-friendly message
+                return self._failed_result(f"Unexpected error during sanitization: {str(e)}"), None
+
+    @staticmethod
+    def _failed_result(error_message: str) -> SanitizationResult:
+        """Build the result reported for a failed sanitization.
+
+        Args:
+            error_message: Description of what went wrong
+
+        Returns:
+            SanitizationResult with success=False and zeroed statistics
+        """
+        return SanitizationResult(
+            success=False,
+            records_processed=0,
+            pii_fields_detected=0,
+            pii_replacements_made=0,
+            error_message=error_message,
+        )
+
+    def sanitize_files(self, paths: list[tuple[Path, Path]]) -> list[SanitizationResult]:
+        """Sanitize several JSON files with the same replacer.
+
+        The replacer's consistency cache persists across files, so a value
+        appearing in several files gets the same fake value in each. With
+        workers > 1, one detection process pool is shared by all files.
+        A failing file does not stop the remaining ones.
+
+        Args:
+            paths: (input_path, output_path) pairs, processed in order
+
+        Returns:
+            One SanitizationResult per pair, in the same order
+
+        Example:
+            >>> results = sanitizer.sanitize_files([
+            ...     (Path("users.json"), Path("users_clean.json")),
+            ...     (Path("orders.json"), Path("orders_clean.json")),
+            ... ])
+            >>> all(result.success for result in results)
+            True
+        """
+        if self._workers > 1 and len(paths) > 1:
+            self._executor = self._create_detection_pool(self._workers)
+
         try:
-            # Read input file
-            records = self._read_json_file(input_path)
-
-            # Sanitize records
-            sanitized_records = self.sanitize_records(records)
-
-            # Write output file
-            self._write_json_file(output_path, sanitized_records)
-
-            # Return success result
-            return SanitizationResult(
-                success=True,
-                records_processed=len(records),
-                pii_fields_detected=self._pii_fields_detected,
-                pii_replacements_made=self._pii_replacements_made,
-                error_message=None,
-            )
+            return [
+                self.sanitize_file(input_path, output_path) for input_path, output_path in paths
+            ]
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
 
-        except (FileNotFoundError, JSONParseError, InvalidOutputPathError) as e:
-            # Return failure result with error message
-            return SanitizationResult(
-                success=False,
-                records_processed=0,
-                pii_fields_detected=0,
-                pii_replacements_made=0,
-                error_message=str(e),
-            )
-        except Exception as e:
-            # Catch unexpected errors and return user-friendly message
-            return SanitizationResult(
-                success=False,
-                records_processed=0,
-                pii_fields_detected=0,
-                pii_replacements_made=0,
-                error_message=f"Unexpected error during sanitization: {str(e)}",
+    @contextmanager
+    def _shared_detection_pool(self) -> Iterator[None]:
+        """Provide one detection process pool for a whole operation.
+
+        Without it, every chunk of records would start and stop its own pool.
+        Does nothing if workers <= 1 or a pool is already provided (e.g. by
+        sanitize_files()).
+
+        Yields:
+            None; the pool is available as self._executor meanwhile
+        """
+        owns_executor = self._workers > 1 and self._executor is None
+        if owns_executor:
+            self._executor = self._create_detection_pool(self._workers)
+
+        try:
+            yield
+        finally:
+            if owns_executor and self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _sanitize_json_stream(self, input_path: Path, output_path: Path) -> int | None:
+        """Sanitize a JSON array file without loading it into memory.
+
+        Records are streamed with _stream_records(), using the same layout as
+        _write_json_file(). The output goes to a temporary file that replaces
+        output_path only after the whole input has been processed.
+
+        Args:
+            input_path: Path to input JSON file
+            output_path: Path where sanitized JSON output will be written
+
+        Returns:
+            Number of records processed, or None if the input could not be
+            streamed (unreadable, not an array, or rejected by ijson) and
+            must be read with _read_json_file() instead
+
+        Raises:
+            InvalidOutputPathError: If output path is invalid or not writable
+        """
+        try:
+            input_file = open(input_path, "rb")
+        except OSError:
+            return None
+
+        with input_file:
+            # Only a top-level array can be streamed record by record
+            first_byte = input_file.read(1)
+            while first_byte and first_byte in b" \t\n\r":
+                first_byte = input_file.read(1)
+            if first_byte != b"[":
+                return None
+            input_file.seek(0)
+
+            temp_path = self._create_temp_output(output_path)
+            try:
+                with open(temp_path, "wb") as output_file:
+                    records_processed = self._stream_records(input_file, output_file)
+                os.replace(temp_path, output_path)
+            except ijson.JSONError:
+                temp_path.unlink(missing_ok=True)
+                return None
+            except OSError as e:
+                temp_path.unlink(missing_ok=True)
+                raise InvalidOutputPathError(
+                    f"Error writing output file: {str(e)}", str(output_path)
+                )
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
+
+        return records_processed
+
+    def _stream_records(self, input_file: BinaryIO, output_file: BinaryIO) -> int:
+        """Sanitize a JSON array from one binary file into another.
+
+        Records are parsed incrementally with ijson and sanitized in chunks of
+        STREAM_CHUNK_SIZE records. Each sanitized record is written as soon as
+        its chunk is done, using the same layout as _serialize_json() gives
+        for the whole array.
+
+        Args:
+            input_file: Binary file positioned at the start of a JSON array
+            output_file: Binary file to write the sanitized array to
+
+        Returns:
+            Number of records processed
+
+        Raises:
+            ijson.JSONError: If the input is not valid JSON; output_file then
+                holds an incomplete document
+        """
+        self._stdlib_json_required = False
+        records = ijson.items(input_file, "item", use_float=True)
+        records_processed = 0
+        output_file.write(b"[")
+        while chunk := list(islice(records, self.STREAM_CHUNK_SIZE)):
+            for record in self.sanitize_records(chunk):
+                output_file.write(b",\n  " if records_processed else b"\n  ")
+                # Indent the record by one level inside the array
+                output_file.write(self._serialize_json(record).replace(b"\n", b"\n  "))
+                records_processed += 1
+        output_file.write(b"\n]" if records_processed else b"]")
+        return records_processed
+
+    def _create_temp_output(self, output_path: Path) -> Path:
+        """Create an empty temporary file next to the output path.
+
+        The file is created with the default permissions for new files (not
+        mkstemp's owner-only mode), so the final output keeps them too.
+
+        Args:
+            output_path: Path where the output will eventually be written
+
+        Returns:
+            Path of the temporary file, on the same filesystem as output_path
+
+        Raises:
+            InvalidOutputPathError: If output path is invalid or not writable
+        """
+        try:
+            # Ensure parent directory exists
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            temp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+            with open(temp_path, "xb"):
+                pass
+            return temp_path
+
+        except PermissionError:
+            raise InvalidOutputPathError(
+                f"Permission denied writing to: {output_path}", str(output_path)
             )
+        except OSError as e:
+            raise InvalidOutputPathError(f"Error writing output file: {str(e)}", str(output_path))
 
     def sanitize_records(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Sanitize a list of records.
@@ -155,13 +570,148 @@ class Sanitizer:
         """
         sanitized_records = []
 
+        # Run batch-capable detectors (e.g. NLP models) once over all strings,
+        # or every detector in worker processes for large inputs
+        self._prefetch_detections(records)
+
+        try:
+            for record in records:
+                sanitized_record = {}
+                for field_name, value in record.items():
+                    sanitized_record[field_name] = self.sanitize_value(value, field_name)
+                sanitized_records.append(sanitized_record)
+        finally:
+            self._batch_detections = {}
+            self._prefetched_detectors = []
+
+        return sanitized_records
+
+    def _prefetch_detections(self, records: list[dict[str, Any]]) -> None:
+        """Run detectors over every unique string value in the records up front.
+
+        Detectors with supports_batch set are called once with all unique
+        (text, field_name) pairs instead of once per field. If more than one
+        worker is configured and there is more than one chunk of strings, all
+        detectors instead run in a process pool, one chunk per task. The
+        results are stored in _batch_detections for _sanitize_string() to
+        pick up.
+
+        Args:
+            records: List of records about to be sanitized
+        """
+        batch_detectors = [d for d in self._detectors if d.supports_batch]
+        if not batch_detectors and self._workers <= 1:
+            return
+
+        # Collect unique string leaves (dict keys act as an ordered set)
+        items: dict[tuple[str, str], None] = {}
         for record in records:
-            sanitized_record = {}
             for field_name, value in record.items():
-                sanitized_record[field_name] = self.sanitize_value(value, field_name)
-            sanitized_records.append(sanitized_record)
+                self._collect_strings(value, field_name, items)
 
-        return sanitized_records
+        # Strings sanitized recently are served from the string cache
+        keys = [key for key in items if key not in self._string_cache]
+        chunk_size = self.PARALLEL_CHUNK_SIZE
+        chunks = [keys[i : i + chunk_size] for i in range(0, len(keys), chunk_size)]
+
+        if self._workers > 1 and len(chunks) > 1:
+            self._batch_detections = dict(zip(keys, self._detect_parallel(chunks), strict=True))
+            self._prefetched_detectors = list(self._detectors)
+            return
+
+        if not batch_detectors:
+            return
+
+        batch_detections: dict[tuple[str, str], list[DetectionResult]] = {key: [] for key in keys}
+        for detector in batch_detectors:
+            detector_keys = keys
+            if self._field_detectors:
+                detector_keys = [key for key in keys if detector in self._detectors_for(key[1])]
+            for key, detections in zip(
+                detector_keys, detector.detect_batch(detector_keys), strict=True
+            ):
+                batch_detections[key].extend(detections)
+
+        self._batch_detections = batch_detections
+        self._prefetched_detectors = batch_detectors
+
+    def _detect_parallel(self, chunks: list[list[tuple[str, str]]]) -> list[list[DetectionResult]]:
+        """Run all detectors over chunks of strings in a process pool.
+
+        Args:
+            chunks: Chunks of (text, field_name) pairs
+
+        Returns:
+            Detections for each pair across all chunks, in input order
+        """
+        if self._executor is not None:
+            return self._map_detection_chunks(self._executor, chunks)
+
+        with self._create_detection_pool(min(self._workers, len(chunks))) as executor:
+            return self._map_detection_chunks(executor, chunks)
+
+    def _create_detection_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        """Create a process pool whose workers build their own detectors.
+
+        Args:
+            max_workers: Number of worker processes
+
+        Returns:
+            Process pool initialized with this sanitizer's detector classes
+        """
+        detector_classes = [type(detector) for detector in self._detectors]
+        field_detector_indices = {
+            field_name: frozenset(
+                index for index, detector in enumerate(self._detectors) if detector in subset
+            )
+            for field_name, subset in self._field_detectors.items()
+        }
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_detection_worker,
+            initargs=(detector_classes, field_detector_indices),
+        )
+
+    def _map_detection_chunks(
+        self, executor: ProcessPoolExecutor, chunks: list[list[tuple[str, str]]]
+    ) -> list[list[DetectionResult]]:
+        """Run _detect_chunk() over chunks in a process pool.
+
+        Args:
+            executor: Process pool to run detection in
+            chunks: Chunks of (text, field_name) pairs
+
+        Returns:
+            Detections for each pair across all chunks, in input order
+        """
+        return [
+            detections
+            for chunk_detections in executor.map(_detect_chunk, chunks, chunksize=1)
+            for detections in chunk_detections
+        ]
+
+    def _collect_strings(
+        self, value: Any, field_name: str, items: dict[tuple[str, str], None]
+    ) -> None:
+        """Collect (text, field_name) pairs for all strings in a value.
+
+        Traverses the value the same way sanitize_value() does, so the
+        collected field names match those passed to the detectors.
+
+        Args:
+            value: The value to traverse
+            field_name: The name of the field containing the value
+            items: Ordered set of collected pairs, updated in place
+        """
+        if isinstance(value, str):
+            if field_name not in self._skip_fields:
+                items[(value, field_name)] = None
+        elif isinstance(value, dict):
+            for key, nested_value in value.items():
+                self._collect_strings(nested_value, key, items)
+        elif isinstance(value, list):
+            for item in value:
+                self._collect_strings(item, field_name, items)
 
     def sanitize_value(self, value: Any, field_name: str) -> Any:
         """Sanitize a single value by detecting and replacing PII.
@@ -189,31 +739,72 @@ class Sanitizer:
             >>> sanitizer.sanitize_value({"name": "John"}, "user")
             {"name": "Michael"}
         """
-        # Handle strings: detect and replace PII
+        # Dispatch on the exact type, which covers everything json produces
+        value_type = type(value)
+        if value_type in _UNCHANGED_TYPES:
+            return value
+        handler = self._value_handlers.get(value_type)
+        if handler is not None:
+            return handler(value, field_name)
+
+        # Subclasses of str, dict, and list are handled like their base type
         if isinstance(value, str):
             return self._sanitize_string(value, field_name)
-
-        # Handle nested dicts: recurse
         elif isinstance(value, dict):
-            sanitized_dict = {}
-            for key, nested_value in value.items():
-                sanitized_dict[key] = self.sanitize_value(nested_value, key)
-            return sanitized_dict
-
-        # Handle lists: recurse
+            return self._sanitize_dict(value, field_name)
         elif isinstance(value, list):
-            return [self.sanitize_value(item, field_name) for item in value]
+            return self._sanitize_list(value, field_name)
 
-        # Handle primitives: return unchanged
+        # Handle other primitives: return unchanged
         else:
             return value
 
+    def _sanitize_dict(self, value: dict[str, Any], field_name: str) -> dict[str, Any]:
+        """Sanitize each value of a dict, using its key as the field name.
+
+        Args:
+            value: The dict to sanitize
+            field_name: The name of the field containing the dict (unused,
+                as nested values are analyzed under their own keys)
+
+        Returns:
+            New dict with the same keys and sanitized values
+        """
+        return {key: self.sanitize_value(nested_value, key) for key, nested_value in value.items()}
+
+    def _sanitize_list(self, value: list[Any], field_name: str) -> list[Any]:
+        """Sanitize each element of a list under the list's field name.
+
+        Args:
+            value: The list to sanitize
+            field_name: The name of the field containing the list
+
+        Returns:
+            New list of sanitized elements
+        """
+        return [self.sanitize_value(item, field_name) for item in value]
+
+    def _detectors_for(self, field_name: str) -> list[Detector]:
+        """Get the detectors to run on strings in the given field.
+
+        Args:
+            field_name: Name of the field being analyzed
+
+        Returns:
+            The field's configured detector subset, or all detectors
+        """
+        return self._field_detectors.get(field_name, self._detectors)
+
     def _sanitize_string(self, text: str, field_name: str) -> str:
         """Sanitize a string by detecting and replacing PII.
 
         This method runs all configured detectors on the text and replaces
         any detected PII with fake data. Multiple PII instances in the same
-        string are all replaced.
+        string are all replaced. Where detections overlap, only the one with
+        the highest confidence (then the longest span) is replaced.
+
+        The last STRING_CACHE_SIZE results are cached by (text, field_name),
+        so repeated values skip detection but still count towards statistics.
 
         Args:
             text: Text to sanitize
@@ -222,11 +813,50 @@ class Sanitizer:
         Returns:
             Sanitized text with all PII replaced
         """
-        # Collect all detections from all detectors
-        all_detections = []
-        for detector in self._detectors:
-            detections = detector.detect(text, field_name)
-            all_detections.extend(detections)
+        if field_name in self._skip_fields:
+            return text
+
+        # Repeated values reuse their result; the replacer maps each original
+        # to a fixed fake, so the text would be rebuilt identically
+        key = (text, field_name)
+        cached = self._string_cache.get(key)
+        if cached is not None:
+            self._string_cache.move_to_end(key)
+            sanitized_text, replacements = cached
+            if replacements:
+                self._pii_fields_detected += 1
+                self._pii_replacements_made += replacements
+            return sanitized_text
+
+        replacements_before = self._pii_replacements_made
+        sanitized_text = self._replace_pii(text, field_name)
+        self._string_cache[key] = (
+            sanitized_text,
+            self._pii_replacements_made - replacements_before,
+        )
+        if len(self._string_cache) > self.STRING_CACHE_SIZE:
+            self._string_cache.popitem(last=False)
+        return sanitized_text
+
+    def _replace_pii(self, text: str, field_name: str) -> str:
+        """Run the detectors on a string and replace the PII they find.
+
+        Args:
+            text: Text to sanitize
+            field_name: Name of the field for detection context
+
+        Returns:
+            Sanitized text with all PII replaced
+        """
+        # Collect all detections from all detectors, reusing prefetched results
+        all_detections: list[DetectionResult] = []
+        batch_detections = self._batch_detections.get((text, field_name))
+        for detector in self._field_detectors.get(field_name, self._detectors):
+            if batch_detections is not None and detector in self._prefetched_detectors:
+                continue
+            all_detections.extend(detector.iter_detect(text, field_name))
+        if batch_detections:
+            all_detections.extend(batch_detections)
 
         # If no PII detected, return original text
         if not all_detections:
@@ -235,34 +865,49 @@ class Sanitizer:
         # Track that we found PII in this field
         self._pii_fields_detected += 1
 
-        # Sort detections by position (reverse order to replace from end to start)
-        # This prevents position shifts when replacing
-        all_detections.sort(key=lambda d: d.start_pos, reverse=True)
+        # Keep one detection per group of overlapping spans, preferring the
+        # higher confidence and then the longer span, so no text is replaced
+        # twice (this also drops detectors reporting the same span)
+        positioned = sorted(
+            (d for d in all_detections if 0 <= d.start_pos < d.end_pos),
+            key=_START_POS,
+        )
+        kept: list[DetectionResult] = []
+        for detection in positioned:
+            if kept and detection.start_pos < kept[-1].end_pos:
+                previous = kept[-1]
+                if (detection.confidence, detection.end_pos - detection.start_pos) > (
+                    previous.confidence,
+                    previous.end_pos - previous.start_pos,
+                ):
+                    kept[-1] = detection
+                continue
+            kept.append(detection)
 
-        # Replace each detected PII
-        sanitized_text = text
-        for detection in all_detections:
-            # Get fake replacement
-            fake_value = self._replacer.replace(detection)
-
-            # Replace in text
-            if detection.start_pos >= 0 and detection.end_pos > detection.start_pos:
-                # Use position information if available
-                sanitized_text = (
-                    sanitized_text[: detection.start_pos]
-                    + fake_value
-                    + sanitized_text[detection.end_pos :]
-                )
-            else:
-                # Fallback: simple string replacement
-                sanitized_text = sanitized_text.replace(
-                    detection.original_value,
-                    fake_value,
-                    1,  # Replace only first occurrence
-                )
+        # Fakes are requested from the last detection to the first; the order
+        # of Faker draws decides seeded output, so it is kept stable
+        fake_values = [self._replacer.replace(detection) for detection in reversed(kept)]
+        fake_values.reverse()
 
-            # Track replacement
-            self._pii_replacements_made += 1
+        # Build the result in one forward pass rather than re-slicing the
+        # whole text for every detection
+        parts = []
+        pos = 0
+        for detection, fake_value in zip(kept, fake_values, strict=True):
+            parts.append(text[pos : detection.start_pos])
+            parts.append(fake_value)
+            pos = detection.end_pos
+        parts.append(text[pos:])
+        sanitized_text = "".join(parts)
+        self._pii_replacements_made += len(kept)
+
+        # Fallback for detections without position information: simple
+        # string replacement of the first occurrence
+        for detection in all_detections:
+            if not 0 <= detection.start_pos < detection.end_pos:
+                fake_value = self._replacer.replace(detection)
+                sanitized_text = sanitized_text.replace(detection.original_value, fake_value, 1)
+                self._pii_replacements_made += 1
 
         return sanitized_text
 
@@ -289,8 +934,7 @@ class Sanitizer:
 
         try:
             # Read and parse JSON
-            with open(input_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._parse_json(input_path.read_bytes())
 
             # Ensure data is a list
             if not isinstance(data, list):
@@ -309,9 +953,58 @@ class Sanitizer:
             # Catch other file reading errors
             raise FileNotFoundError(f"Error reading file: {str(e)}", str(input_path))
 
+    def _parse_json(self, raw: bytes) -> Any:
+        """Parse JSON bytes, using orjson when it is installed.
+
+        Documents orjson rejects or could parse lossily (NaN, Infinity,
+        integers beyond 64 bits) are parsed with the stdlib json module
+        instead, and the output is then also written with json so those
+        values round-trip unchanged.
+
+        Args:
+            raw: UTF-8 encoded JSON document
+
+        Returns:
+            Parsed JSON data
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON
+        """
+        self._stdlib_json_required = False
+        if orjson is not None and _LONG_NUMBER_SEARCH(raw) is None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Fall through so errors report json's line and column
+                pass
+
+        self._stdlib_json_required = True
+        return json.loads(raw.decode("utf-8"))
+
+    def _serialize_json(self, data: Any) -> bytes:
+        """Serialize data as indented UTF-8 JSON, using orjson when possible.
+
+        Args:
+            data: Data to serialize
+
+        Returns:
+            JSON document indented by two spaces, without escaping non-ASCII
+        """
+        if orjson is not None and not self._stdlib_json_required:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                # Values orjson cannot encode, e.g. integers beyond 64 bits
+                pass
+
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
     def _write_json_file(self, output_path: Path, data: list[dict[str, Any]]) -> None:
         """Write data to a JSON file.
 
+        The document is written to a temporary file that replaces output_path
+        once complete, so a failed write never leaves a truncated output.
+
         Args:
             output_path: Path where JSON will be written
             data: Data to write as JSON
@@ -319,13 +1012,11 @@ class Sanitizer:
         Raises:
             InvalidOutputPathError: If output path is invalid or not writable
         """
+        temp_path = self._create_temp_output(output_path)
         try:
-            # Ensure parent directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Write JSON with pretty formatting
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            temp_path.write_bytes(self._serialize_json(data))
+            os.replace(temp_path, output_path)
 
         except PermissionError:
             raise InvalidOutputPathError(
@@ -337,3 +1028,5 @@ class Sanitizer:
             raise InvalidOutputPathError(
                 f"Unexpected error writing output: {str(e)}", str(output_path)
             )
+        finally:
+            temp_path.unlink(missing_ok=True)
@@ -6,20 +6,26 @@ The interface allows users to upload JSON files, configure output settings, trig
 sanitization, view results, and download sanitized files.
 """
 
+import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import streamlit as st
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
-from data_sanitizer.detectors.credit_card_detector import CreditCardDetector
-from data_sanitizer.detectors.email_detector import EmailDetector
+from data_sanitizer.detectors.base import Detector
+from data_sanitizer.detectors.multi_regex_detector import MultiRegexDetector
 from data_sanitizer.detectors.name_detector import NameDetector
-from data_sanitizer.detectors.phone_detector import PhoneDetector
 from data_sanitizer.models import SanitizationResult
 from data_sanitizer.replacer import Replacer
 from data_sanitizer.sanitizer import Sanitizer
 
+# Background threads shared by all sessions for running sanitizations
+SANITIZATION_THREADS = 2
+
+# Seconds to wait on a running sanitization before rerunning the script
+POLL_INTERVAL_SECONDS = 0.5
+
 
 def validate_output_filename(filename: str) -> str:
     """Validate and normalize output filename.
@@ -51,12 +57,33 @@ def validate_output_filename(filename: str) -> str:
     return filename
 
 
+@st.cache_resource
+def load_detectors() -> list[Detector]:
+    """Create the PII detectors once and share them across reruns and sessions.
+
+    Detectors hold no per-run state, so a single set can serve every
+    sanitization. Building them (compiling patterns, loading the NLP model
+    behind NameDetector) would otherwise happen on every button click.
+
+    Emails, phone numbers, and credit cards are found by MultiRegexDetector
+    in a single scan per value, as in the CLI, rather than by three
+    separate detectors.
+
+    Returns:
+        MultiRegexDetector and NameDetector instances
+    """
+    return [MultiRegexDetector(), NameDetector()]
+
+
 def initialize_sanitizer() -> Sanitizer:
     """Initialize sanitizer with all detectors and replacer.
 
-    Creates a Sanitizer instance configured with all four PII detectors
-    (EmailDetector, PhoneDetector, NameDetector, CreditCardDetector) and
-    a Replacer instance for generating fake data replacements.
+    Creates a Sanitizer instance configured with the PII detectors
+    (MultiRegexDetector for emails, phones, and credit cards, plus
+    NameDetector) and a Replacer instance for generating fake data replacements. The
+    detectors are cached by load_detectors(); the Sanitizer and Replacer
+    are created per call, since they keep per-run statistics and a
+    consistency cache that must not be shared between users.
 
     Returns:
         Configured Sanitizer instance ready for use
@@ -66,13 +93,8 @@ def initialize_sanitizer() -> Sanitizer:
         >>> isinstance(sanitizer, Sanitizer)
         True
     """
-    # Initialize all four detectors
-    detectors = [
-        EmailDetector(),
-        PhoneDetector(),
-        NameDetector(),
-        CreditCardDetector(),
-    ]
+    # Reuse the cached detectors
+    detectors = load_detectors()
 
     # Create Replacer instance with seed=None for random fake data
     replacer = Replacer(seed=None)
@@ -81,18 +103,113 @@ def initialize_sanitizer() -> Sanitizer:
     return Sanitizer(detectors=detectors, replacer=replacer)
 
 
+@st.cache_resource
+def get_sanitization_executor() -> ThreadPoolExecutor:
+    """Create the thread pool that runs sanitizations off the script thread.
+
+    The pool is shared across reruns and sessions, so a rerun triggered by
+    any widget interaction does not abandon a sanitization in progress.
+
+    Returns:
+        ThreadPoolExecutor with SANITIZATION_THREADS worker threads
+    """
+    return ThreadPoolExecutor(max_workers=SANITIZATION_THREADS, thread_name_prefix="sanitize")
+
+
+def start_sanitization(
+    uploaded_file: UploadedFile,
+) -> Future[tuple[SanitizationResult, bytes | None]]:
+    """Start sanitizing an uploaded file in the background.
+
+    The sanitizer is built on the calling (script) thread, because the cached
+    detectors need Streamlit's script run context; only the sanitization
+    itself runs on the executor.
+
+    Args:
+        uploaded_file: Streamlit uploaded file object containing JSON data
+
+    Returns:
+        Future resolving to the SanitizationResult and the sanitized content
+        (None if sanitization failed)
+
+    Example:
+        >>> future = start_sanitization(uploaded_file)
+        >>> result, content = future.result()
+    """
+    try:
+        sanitizer = initialize_sanitizer()
+    except Exception as e:
+        # Report setup errors through the future like sanitization errors
+        failed: Future[tuple[SanitizationResult, bytes | None]] = Future()
+        failed.set_exception(e)
+        return failed
+    return get_sanitization_executor().submit(sanitizer.sanitize_bytes, uploaded_file.getvalue())
+
+
+def collect_sanitization(
+    future: Future[tuple[SanitizationResult, bytes | None]],
+) -> tuple[SanitizationResult, bytes | None]:
+    """Get the outcome of a finished background sanitization.
+
+    Unexpected errors raised by the sanitization are converted into a
+    failed SanitizationResult so the app keeps running.
+
+    Args:
+        future: Completed future returned by start_sanitization()
+
+    Returns:
+        Tuple containing:
+        - SanitizationResult with statistics and status
+        - Sanitized file content as bytes (None if sanitization failed)
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        error_result = SanitizationResult(
+            success=False,
+            records_processed=0,
+            pii_fields_detected=0,
+            pii_replacements_made=0,
+            error_message=f"An unexpected error occurred: {str(e)}. "
+            "Please check your input file and try again."
+        )
+        return error_result, None
+
+
+def upload_digest(uploaded_file: UploadedFile) -> str:
+    """Compute a digest identifying the content of an uploaded file.
+
+    main() compares digests to reuse the previous sanitization when the same
+    content is sanitized again, even if it was uploaded anew.
+
+    Args:
+        uploaded_file: Streamlit uploaded file object
+
+    Returns:
+        Hex digest of the uploaded bytes
+
+    Example:
+        >>> digest = upload_digest(uploaded_file)
+        >>> len(digest)
+        32
+    """
+    return hashlib.blake2b(uploaded_file.getvalue(), digest_size=16).hexdigest()
+
+
 def process_sanitization(
     uploaded_file: UploadedFile, output_filename: str
 ) -> tuple[SanitizationResult, bytes | None]:
     """Process file sanitization.
 
-    Handles the complete sanitization workflow: writes the uploaded file to a
-    temporary location, initializes the sanitizer, performs sanitization, and
-    reads the sanitized output. Temporary files are automatically cleaned up.
+    Handles the complete sanitization workflow: initializes the sanitizer and
+    sanitizes the uploaded content in memory, without staging it on disk.
+    Blocks until done; main() uses start_sanitization() instead to keep the
+    interface responsive.
 
     Args:
         uploaded_file: Streamlit uploaded file object containing JSON data
-        output_filename: Desired output filename (should include .json extension)
+        output_filename: Desired output filename (should include .json extension);
+            the download button uses it, nothing is written under this name
 
     Returns:
         Tuple containing:
@@ -104,26 +221,8 @@ def process_sanitization(
         >>> if result.success:
         ...     print(f"Processed {result.records_processed} records")
     """
-    # Create temporary directory for file operations
-    with TemporaryDirectory() as tmpdir:
-        # Write uploaded file content to temporary input file
-        input_path = Path(tmpdir) / "input.json"
-        input_path.write_bytes(uploaded_file.getvalue())
-
-        # Create output path in temporary directory
-        output_path = Path(tmpdir) / output_filename
-
-        # Initialize sanitizer and call sanitize_file()
-        sanitizer = initialize_sanitizer()
-        result = sanitizer.sanitize_file(input_path, output_path)
-
-        # If successful, read sanitized file content as bytes
-        if result.success:
-            file_content = output_path.read_bytes()
-            return result, file_content
-
-        # Return result with None content if failed
-        return result, None
+    # Sanitize the uploaded bytes directly and wait for the outcome
+    return start_sanitization(uploaded_file).result()
 
 
 def render_header() -> None:
@@ -289,6 +388,10 @@ def main() -> None:
         st.session_state["sanitized_content"] = None
     if "output_filename" not in st.session_state:
         st.session_state["output_filename"] = None
+    if "sanitization_future" not in st.session_state:
+        st.session_state["sanitization_future"] = None
+    if "sanitized_digest" not in st.session_state:
+        st.session_state["sanitized_digest"] = None
 
     # File upload section
     st.divider()
@@ -330,27 +433,33 @@ def main() -> None:
 
     # Create sanitize button
     if st.button("🔒 Sanitize File", disabled=not button_enabled, type="primary"):
-        # Show progress spinner
-        with st.spinner("Processing... Please wait while we sanitize your file."):
-            try:
-                # Call process_sanitization
-                result, file_content = process_sanitization(uploaded_file, validated_filename)
-
-                # Store result and file content in session state
-                st.session_state["sanitization_result"] = result
-                st.session_state["sanitized_content"] = file_content
-            except Exception as e:
-                # Catch any unexpected errors and store error result
-                error_result = SanitizationResult(
-                    success=False,
-                    records_processed=0,
-                    pii_fields_detected=0,
-                    pii_replacements_made=0,
-                    error_message=f"An unexpected error occurred: {str(e)}. "
-                    "Please check your input file and try again."
-                )
-                st.session_state["sanitization_result"] = error_result
-                st.session_state["sanitized_content"] = None
+        # Reuse a running or successful sanitization of the same content
+        digest = upload_digest(uploaded_file)
+        already_sanitized = digest == st.session_state["sanitized_digest"] and (
+            st.session_state["sanitization_future"] is not None
+            or st.session_state["sanitized_content"] is not None
+        )
+        if not already_sanitized:
+            # Run the sanitization in the background and clear previous results
+            st.session_state["sanitization_future"] = start_sanitization(uploaded_file)
+            st.session_state["sanitized_digest"] = digest
+            st.session_state["sanitization_result"] = None
+            st.session_state["sanitized_content"] = None
+
+    # Poll a running sanitization; reruns keep the page interactive meanwhile
+    future = st.session_state["sanitization_future"]
+    if future is not None:
+        if future.done():
+            # Store result and file content in session state
+            result, file_content = collect_sanitization(future)
+            st.session_state["sanitization_result"] = result
+            st.session_state["sanitized_content"] = file_content
+            st.session_state["sanitization_future"] = None
+        else:
+            # Show progress spinner
+            with st.spinner("Processing... Please wait while we sanitize your file."):
+                wait([future], timeout=POLL_INTERVAL_SECONDS)
+            st.rerun()
 
     # Results display section
     if st.session_state["sanitization_result"] is not None:
@@ -18,9 +18,23 @@ from data_sanitizer.replacer import Replacer
 from data_sanitizer.sanitizer import Sanitizer
 
 
-@pytest.fixture
+def _read_json(path):
+    """Parse a UTF-8 JSON file in one call."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _records_by_user_id(records):
+    """Index sanitized records by their user_id for direct lookups."""
+    return {record.get("user_id"): record for record in records}
+
+
+@pytest.fixture(scope="module")
 def all_detectors():
-    """Create a list of all available detectors."""
+    """Create a list of all available detectors, shared by the module's tests.
+
+    Detectors keep no per-run state; the stateful Replacer and Sanitizer
+    fixtures below stay function-scoped so every test starts from seed 42.
+    """
     return [
         EmailDetector(),
         PhoneDetector(),
@@ -49,12 +63,32 @@ def sample_dirty_data_path():
     return Path("tests/fixtures/sample_dirty_data.json")
 
 
+@pytest.fixture(scope="module")
+def sample_dirty_data():
+    """Parsed sample dirty data fixture, loaded once per module (read-only)."""
+    return _read_json("tests/fixtures/sample_dirty_data.json")
+
+
 @pytest.fixture
 def edge_cases_path():
     """Path to edge cases fixture."""
     return Path("tests/fixtures/edge_cases.json")
 
 
+@pytest.fixture(scope="module")
+def edge_cases_by_user_id(all_detectors, tmp_path_factory):
+    """Sanitize the edge cases fixture once with seed 42, indexed by user_id.
+
+    The tests inspecting individual edge-case records only read the output,
+    so they share this single run instead of each sanitizing the file.
+    """
+    output_path = tmp_path_factory.mktemp("edge_cases") / "edge_cases_output.json"
+    sanitizer = Sanitizer(detectors=all_detectors, replacer=Replacer(seed=42))
+    sanitizer.sanitize_file(Path("tests/fixtures/edge_cases.json"), output_path)
+
+    return _records_by_user_id(_read_json(output_path))
+
+
 @pytest.fixture
 def invalid_json_path():
     """Path to invalid JSON fixture."""
@@ -82,8 +116,7 @@ class TestFullSanitizationWorkflow:
 
         # Verify output file exists and is valid JSON
         assert output_path.exists()
-        with open(output_path, encoding="utf-8") as f:
-            sanitized_data = json.load(f)
+        sanitized_data = _read_json(output_path)
 
         # Verify structure is preserved
         assert len(sanitized_data) == 10
@@ -96,37 +129,31 @@ class TestFullSanitizationWorkflow:
         # Sanitize
         sanitizer_with_seed.sanitize_file(sample_dirty_data_path, output_path)
 
-        # Load sanitized data
-        with open(output_path, encoding="utf-8") as f:
-            sanitized_data = json.load(f)
-
-        # Check that specific known PII values are replaced
-        sanitized_json_str = json.dumps(sanitized_data)
+        # Search the output bytes directly rather than re-serializing them
+        sanitized_bytes = output_path.read_bytes()
+        lowered_bytes = sanitized_bytes.lower()
 
         # These PII values should not appear in sanitized output
-        assert "john.doe@example.com" not in sanitized_json_str.lower()
-        assert "jane.smith@example.com" not in sanitized_json_str.lower()
-        assert "alice@test.com" not in sanitized_json_str.lower()
-        assert "John Doe" not in sanitized_json_str
-        assert "Alice Johnson" not in sanitized_json_str
-
-    def test_non_pii_is_preserved(self, sanitizer_with_seed, sample_dirty_data_path, tmp_path):
+        assert b"john.doe@example.com" not in lowered_bytes
+        assert b"jane.smith@example.com" not in lowered_bytes
+        assert b"alice@test.com" not in lowered_bytes
+        assert b"John Doe" not in sanitized_bytes
+        assert b"Alice Johnson" not in sanitized_bytes
+
+    def test_non_pii_is_preserved(
+        self, sanitizer_with_seed, sample_dirty_data_path, sample_dirty_data, tmp_path
+    ):
         """Verify that non-PII fields are preserved exactly."""
         output_path = tmp_path / "sanitized_output.json"
 
-        # Load original data
-        with open(sample_dirty_data_path, encoding="utf-8") as f:
-            original_data = json.load(f)
-
         # Sanitize
         sanitizer_with_seed.sanitize_file(sample_dirty_data_path, output_path)
 
         # Load sanitized data
-        with open(output_path, encoding="utf-8") as f:
-            sanitized_data = json.load(f)
+        sanitized_data = _read_json(output_path)
 
         # Check non-PII fields are preserved
-        for i, (original, sanitized) in enumerate(zip(original_data, sanitized_data)):
+        for i, (original, sanitized) in enumerate(zip(sample_dirty_data, sanitized_data)):
             # User IDs should be preserved
             assert original["user_id"] == sanitized["user_id"]
 
@@ -168,44 +195,24 @@ class TestEdgeCases:
         assert output_path.exists()
 
         # Verify output is valid JSON
-        with open(output_path, encoding="utf-8") as f:
-            sanitized_data = json.load(f)
+        sanitized_data = _read_json(output_path)
 
         assert len(sanitized_data) == 11
 
-    def test_deeply_nested_pii(self, sanitizer_with_seed, edge_cases_path, tmp_path):
+    def test_deeply_nested_pii(self, edge_cases_by_user_id):
         """Test that deeply nested PII is detected and replaced."""
-        output_path = tmp_path / "nested_output.json"
-
-        # Load original
-        # Sanitize
-        sanitizer_with_seed.sanitize_file(edge_cases_path, output_path)
-
-        # Load sanitized
-        with open(output_path, encoding="utf-8") as f:
-            sanitized_data = json.load(f)
-
         # Find the deeply nested record (user_id 2)
-        nested_record = next(r for r in sanitized_data if r.get("user_id") == 2)
+        nested_record = edge_cases_by_user_id[2]
 
         # Verify PII was replaced in deep nesting
         deep_email = nested_record["deeply"]["nested"]["structure"]["with"]["pii"]["email"]
         assert deep_email != "deep.nested@example.com"
         assert "@" in deep_email  # Should still be an email
 
-    def test_mixed_pii_in_single_field(self, sanitizer_with_seed, edge_cases_path, tmp_path):
+    def test_mixed_pii_in_single_field(self, edge_cases_by_user_id):
         """Test that multiple PII types in one field are all replaced."""
-        output_path = tmp_path / "mixed_output.json"
-
-        # Sanitize
-        sanitizer_with_seed.sanitize_file(edge_cases_path, output_path)
-
-        # Load sanitized
-        with open(output_path, encoding="utf-8") as f:
-            sanitized_data = json.load(f)
-
         # Find the mixed PII record (user_id 3)
-        mixed_record = next(r for r in sanitized_data if r.get("user_id") == 3)
+        mixed_record = edge_cases_by_user_id[3]
         mixed_field = mixed_record["mixed_pii_field"]
 
         # Original PII should not be present
@@ -213,39 +220,21 @@ class TestEdgeCases:
         assert "jane.doe@test.com" not in mixed_field.lower()
         assert "John Smith" not in mixed_field
 
-    def test_duplicate_pii_consistency(self, sanitizer_with_seed, edge_cases_path, tmp_path):
+    def test_duplicate_pii_consistency(self, edge_cases_by_user_id):
         """Test that duplicate PII values are replaced consistently."""
-        output_path = tmp_path / "duplicate_output.json"
-
-        # Sanitize
-        sanitizer_with_seed.sanitize_file(edge_cases_path, output_path)
-
-        # Load sanitized
-        with open(output_path, encoding="utf-8") as f:
-            sanitized_data = json.load(f)
-
         # Find records with duplicate PII (user_id 4 and 5)
-        record_4 = next(r for r in sanitized_data if r.get("user_id") == 4)
-        record_5 = next(r for r in sanitized_data if r.get("user_id") == 5)
+        record_4 = edge_cases_by_user_id[4]
+        record_5 = edge_cases_by_user_id[5]
 
         # Same original PII should map to same fake PII
         assert record_4["name"] == record_5["name"]
         assert record_4["email"] == record_5["email"]
         assert record_4["phone"] == record_5["phone"]
 
-    def test_empty_and_null_values(self, sanitizer_with_seed, edge_cases_path, tmp_path):
+    def test_empty_and_null_values(self, edge_cases_by_user_id):
         """Test handling of empty and null values."""
-        output_path = tmp_path / "empty_output.json"
-
-        # Sanitize
-        sanitizer_with_seed.sanitize_file(edge_cases_path, output_path)
-
-        # Load sanitized
-        with open(output_path, encoding="utf-8") as f:
-            sanitized_data = json.load(f)
-
         # Find record with empty values (user_id 7)
-        empty_record = next(r for r in sanitized_data if r.get("user_id") == 7)
+        empty_record = edge_cases_by_user_id[7]
 
         # Empty and null values should be preserved
         assert empty_record["empty_array"] == []
@@ -254,19 +243,10 @@ class TestEdgeCases:
         assert empty_record["zero"] == 0
         assert empty_record["false_value"] is False
 
-    def test_special_format_pii(self, sanitizer_with_seed, edge_cases_path, tmp_path):
+    def test_special_format_pii(self, edge_cases_by_user_id):
         """Test detection of PII in special formats."""
-        output_path = tmp_path / "special_output.json"
-
-        # Sanitize
-        sanitizer_with_seed.sanitize_file(edge_cases_path, output_path)
-
-        # Load sanitized
-        with open(output_path, encoding="utf-8") as f:
-            sanitized_data = json.load(f)
-
         # Find record with special formats (user_id 8)
-        special_record = next(r for r in sanitized_data if r.get("user_id") == 8)
+        special_record = edge_cases_by_user_id[8]
         special_formats = special_record["special_formats"]
 
         # Verify emails with special characters are replaced
@@ -298,10 +278,8 @@ class TestConsistencyAcrossRuns:
         sanitizer_2.sanitize_file(sample_dirty_data_path, output_path_2)
 
         # Load both outputs
-        with open(output_path_1, encoding="utf-8") as f:
-            output_1 = json.load(f)
-        with open(output_path_2, encoding="utf-8") as f:
-            output_2 = json.load(f)
+        output_1 = _read_json(output_path_1)
+        output_2 = _read_json(output_path_2)
 
         # Outputs should be identical
         assert output_1 == output_2
@@ -324,10 +302,8 @@ class TestConsistencyAcrossRuns:
         sanitizer_2.sanitize_file(sample_dirty_data_path, output_path_2)
 
         # Load both outputs
-        with open(output_path_1, encoding="utf-8") as f:
-            output_1 = json.load(f)
-        with open(output_path_2, encoding="utf-8") as f:
-            output_2 = json.load(f)
+        output_1 = _read_json(output_path_1)
+        output_2 = _read_json(output_path_2)
 
         # Outputs should be different (at least some PII replacements differ)
         assert output_1 != output_2
@@ -343,8 +319,7 @@ class TestOutputCanBeReparsedAndResanitized:
         sanitizer_with_seed.sanitize_file(sample_dirty_data_path, output_path)
 
         # Should be able to parse without errors
-        with open(output_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(output_path)
 
         assert isinstance(data, list)
         assert len(data) > 0
@@ -370,10 +345,8 @@ class TestOutputCanBeReparsedAndResanitized:
         # pii_replacements_made == 0, but it should be much lower
 
         # Load both outputs
-        with open(output_path_1, encoding="utf-8") as f:
-            output_1 = json.load(f)
-        with open(output_path_2, encoding="utf-8") as f:
-            output_2 = json.load(f)
+        output_1 = _read_json(output_path_1)
+        output_2 = _read_json(output_path_2)
 
         # Outputs should be very similar (allowing for potential fake PII detection)
         assert len(output_1) == len(output_2)
@@ -461,17 +434,15 @@ class TestErrorHandling:
 class TestStatisticsAccuracy:
     """Test that sanitization statistics are accurate."""
 
-    def test_records_processed_count(self, sanitizer_with_seed, sample_dirty_data_path, tmp_path):
+    def test_records_processed_count(
+        self, sanitizer_with_seed, sample_dirty_data_path, sample_dirty_data, tmp_path
+    ):
         """Test that records_processed count is accurate."""
         output_path = tmp_path / "output.json"
 
-        # Load original to count records
-        with open(sample_dirty_data_path, encoding="utf-8") as f:
-            original_data = json.load(f)
-
         result = sanitizer_with_seed.sanitize_file(sample_dirty_data_path, output_path)
 
-        assert result.records_processed == len(original_data)
+        assert result.records_processed == len(sample_dirty_data)
 
     def test_pii_fields_detected_count(self, sanitizer_with_seed, sample_dirty_data_path, tmp_path):
         """Test that pii_fields_detected count is reasonable."""
@@ -11,12 +11,24 @@ from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from data_sanitizer.cli import main, parse_arguments
 
 
+@pytest.fixture(scope="class")
+def cli_paths(tmp_path_factory):
+    """Input and output paths reused by every example of a property test.
+
+    Each example overwrites the input and the CLI replaces the output, so
+    nothing needs to be created or removed per example.
+    """
+    tmp_path = tmp_path_factory.mktemp("cli")
+    return tmp_path / "input.json", tmp_path / "output.json"
+
+
 class TestCLIMissingArgumentsProperty:
     """Property 17: CLI Missing Arguments Error.
 
@@ -39,27 +51,23 @@ class TestCLIMissingArgumentsProperty:
         Args:
             args: List of 0 or 1 arguments (missing at least one required arg)
         """
-        # Build argv with program name and provided args
-        argv = ["data-sanitizer"] + args
-
-        # Mock sys.argv and capture stderr
-        with patch("sys.argv", argv):
-            captured_error = StringIO()
-            with patch("sys.stderr", captured_error):
-                try:
-                    parse_arguments()
-                    # If we get here, arguments were somehow valid (shouldn't happen)
-                    # This is acceptable for the edge case where hypothesis generates
-                    # exactly 2 valid-looking arguments
-                    pass
-                except SystemExit as e:
-                    # Verify non-zero exit code
-                    assert e.code != 0, f"Expected non-zero exit code, got {e.code}"
-
-                    # Verify usage information is displayed
-                    error_output = captured_error.getvalue()
-                    # argparse displays usage info which includes the program name
-                    assert len(error_output) > 0, "Expected usage information in stderr"
+        # Capture stderr
+        captured_error = StringIO()
+        with patch("sys.stderr", captured_error):
+            try:
+                parse_arguments(args)
+                # If we get here, arguments were somehow valid (shouldn't happen)
+                # This is acceptable for the edge case where hypothesis generates
+                # exactly 2 valid-looking arguments
+                pass
+            except SystemExit as e:
+                # Verify non-zero exit code
+                assert e.code != 0, f"Expected non-zero exit code, got {e.code}"
+
+                # Verify usage information is displayed
+                error_output = captured_error.getvalue()
+                # argparse displays usage info which includes the program name
+                assert len(error_output) > 0, "Expected usage information in stderr"
 
 
 class TestCLIExitCodeProperty:
@@ -91,7 +99,7 @@ class TestCLIExitCodeProperty:
             max_size=10,
         )
     )
-    def test_cli_exit_code_success(self, records: list[dict]) -> None:
+    def test_cli_exit_code_success(self, cli_paths, records: list[dict]) -> None:
         """Test that successful sanitization returns exit code 0.
 
         Feature: data-sanitizer, Property 18: CLI Exit Code Correctness
@@ -100,32 +108,19 @@ class TestCLIExitCodeProperty:
         returns exit code 0.
 
         Args:
+            cli_paths: Shared (input_path, output_path) pair
             records: Random list of records to sanitize
         """
-        # Create temporary input file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            input_path = Path(f.name)
-            json.dump(records, f)
+        # Write this example's records to the shared input file
+        input_path, output_path = cli_paths
+        input_path.write_text(json.dumps(records), encoding="utf-8")
 
-        # Create temporary output file path
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            output_path = Path(f.name)
+        # Suppress output
+        with patch("sys.stdout", StringIO()):
+            exit_code = main([str(input_path), str(output_path)])
 
-        try:
-            # Mock sys.argv
-            with patch("sys.argv", ["data-sanitizer", str(input_path), str(output_path)]):
-                # Suppress output
-                with patch("sys.stdout", StringIO()):
-                    exit_code = main()
-
-            # Verify exit code is 0 for success
-            assert exit_code == 0, (
-                f"Expected exit code 0 for successful sanitization, got {exit_code}"
-            )
-
-        finally:
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # Verify exit code is 0 for success
+        assert exit_code == 0, f"Expected exit code 0 for successful sanitization, got {exit_code}"
 
     def test_cli_exit_code_failure_file_not_found(self) -> None:
         """Test that file not found returns non-zero exit code.
@@ -139,11 +134,9 @@ class TestCLIExitCodeProperty:
         input_path = "nonexistent_file_12345.json"
         output_path = "output.json"
 
-        # Mock sys.argv
-        with patch("sys.argv", ["data-sanitizer", input_path, output_path]):
-            # Suppress output
-            with patch("sys.stderr", StringIO()):
-                exit_code = main()
+        # Suppress output
+        with patch("sys.stderr", StringIO()):
+            exit_code = main([input_path, output_path])
 
         # Verify exit code is non-zero for failure
         assert exit_code != 0, f"Expected non-zero exit code for failure, got {exit_code}"
@@ -164,11 +157,9 @@ class TestCLIExitCodeProperty:
         output_path = Path("output.json")
 
         try:
-            # Mock sys.argv
-            with patch("sys.argv", ["data-sanitizer", str(input_path), str(output_path)]):
-                # Suppress output
-                with patch("sys.stderr", StringIO()):
-                    exit_code = main()
+            # Suppress output
+            with patch("sys.stderr", StringIO()):
+                exit_code = main([str(input_path), str(output_path)])
 
             # Verify exit code is non-zero for failure
             assert exit_code != 0, f"Expected non-zero exit code for invalid JSON, got {exit_code}"
@@ -200,7 +191,7 @@ class TestCLISummaryDisplayProperty:
             max_size=10,
         )
     )
-    def test_cli_summary_display(self, records: list[dict]) -> None:
+    def test_cli_summary_display(self, cli_paths, records: list[dict]) -> None:
         """Test that CLI displays summary statistics on success.
 
         Feature: data-sanitizer, Property 19: CLI Summary Display
@@ -209,48 +200,35 @@ class TestCLISummaryDisplayProperty:
         displays summary statistics including records processed and PII detected.
 
         Args:
+            cli_paths: Shared (input_path, output_path) pair
             records: Random list of records to sanitize
         """
-        # Create temporary input file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            input_path = Path(f.name)
-            json.dump(records, f)
+        # Write this example's records to the shared input file
+        input_path, output_path = cli_paths
+        input_path.write_text(json.dumps(records), encoding="utf-8")
 
-        # Create temporary output file path
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            output_path = Path(f.name)
+        # Capture stdout
+        captured_output = StringIO()
+        with patch("sys.stdout", captured_output):
+            exit_code = main([str(input_path), str(output_path)])
 
-        try:
-            # Mock sys.argv
-            with patch("sys.argv", ["data-sanitizer", str(input_path), str(output_path)]):
-                # Capture stdout
-                captured_output = StringIO()
-                with patch("sys.stdout", captured_output):
-                    exit_code = main()
-
-            # Verify success
-            assert exit_code == 0, "Sanitization should succeed"
-
-            # Verify summary is displayed
-            output = captured_output.getvalue()
-
-            # Check for required summary elements
-            assert "Sanitization completed successfully" in output, (
-                "Summary should contain success message"
-            )
-            assert "Records processed:" in output, "Summary should contain records processed count"
-            assert "PII fields detected:" in output, (
-                "Summary should contain PII fields detected count"
-            )
-            assert "PII replacements made:" in output, (
-                "Summary should contain PII replacements made count"
-            )
-
-            # Verify the count matches the input
-            assert f"Records processed: {len(records)}" in output, (
-                f"Summary should show {len(records)} records processed"
-            )
+        # Verify success
+        assert exit_code == 0, "Sanitization should succeed"
 
-        finally:
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # Verify summary is displayed
+        output = captured_output.getvalue()
+
+        # Check for required summary elements
+        assert "Sanitization completed successfully" in output, (
+            "Summary should contain success message"
+        )
+        assert "Records processed:" in output, "Summary should contain records processed count"
+        assert "PII fields detected:" in output, "Summary should contain PII fields detected count"
+        assert "PII replacements made:" in output, (
+            "Summary should contain PII replacements made count"
+        )
+
+        # Verify the count matches the input
+        assert f"Records processed: {len(records)}" in output, (
+            f"Summary should show {len(records)} records processed"
+        )
@@ -4,12 +4,75 @@ This module contains property tests that verify universal correctness
 properties of PII detection across all inputs using randomized testing.
 """
 
-from hypothesis import given, settings
+import random
+
+import pytest
+from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
 
+from data_sanitizer.detectors.credit_card_detector import CreditCardDetector
 from data_sanitizer.detectors.email_detector import EmailDetector
+from data_sanitizer.detectors.name_detector import NameDetector
+from data_sanitizer.detectors.phone_detector import PhoneDetector
 from data_sanitizer.models import PIIType
 
+# Detection is deterministic, so fixed example generation makes CI runs
+# reproducible. Derandomized runs never use an example database. The profile
+# is the parent of each test's settings here rather than loaded globally.
+settings.register_profile(
+    "sanitizer_fast",
+    derandomize=True,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+FAST_SETTINGS = settings.get_profile("sanitizer_fast")
+
+
+# Detectors hold no per-input state, so each is built once per module rather
+# than once per generated example.
+@pytest.fixture(scope="module")
+def email_detector():
+    """Create a shared EmailDetector instance."""
+    return EmailDetector()
+
+
+@pytest.fixture(scope="module")
+def phone_detector():
+    """Create a shared PhoneDetector instance."""
+    return PhoneDetector()
+
+
+@pytest.fixture(scope="module")
+def name_detector():
+    """Create a shared NameDetector instance."""
+    return NameDetector()
+
+
+@pytest.fixture(scope="module")
+def credit_card_detector():
+    """Create a shared CreditCardDetector instance."""
+    return CreditCardDetector()
+
+
+ALPHA = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DIGITS = "0123456789"
+ALNUM = ALPHA + DIGITS
+
+
+def _alnum_bounded_text(inner_alphabet: str, max_size: int):
+    """Build text of 1 to max_size characters that starts and ends alphanumeric.
+
+    The first and last characters are drawn from ALNUM directly, so no
+    generated example is ever rejected by a filter.
+    """
+    return st.one_of(
+        st.sampled_from(ALNUM),
+        st.tuples(
+            st.sampled_from(ALNUM),
+            st.text(alphabet=inner_alphabet, max_size=max_size - 2),
+            st.sampled_from(ALNUM),
+        ).map("".join),
+    )
+
 
 # Strategy for generating valid email addresses
 @st.composite
@@ -21,24 +84,14 @@ def email_addresses(draw):
     - Domain: alphanumeric with dots and hyphens
     - TLD: 2-10 alphabetic characters
     """
-    # Local part: 1-20 characters
-    local_chars = st.text(
-        alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-",
-        min_size=1,
-        max_size=20,
-    ).filter(lambda x: x[0].isalnum() and x[-1].isalnum())  # Start and end with alphanumeric
-
-    # Domain: 1-20 characters
-    domain_chars = st.text(
-        alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-",
-        min_size=1,
-        max_size=20,
-    ).filter(lambda x: x[0].isalnum() and x[-1].isalnum())  # Start and end with alphanumeric
+    # Local part: 1-20 characters, starting and ending with alphanumeric
+    local_chars = _alnum_bounded_text(ALNUM + "._%+-", max_size=20)
+
+    # Domain: 1-20 characters, starting and ending with alphanumeric
+    domain_chars = _alnum_bounded_text(ALNUM + ".-", max_size=20)
 
     # TLD: 2-10 alphabetic characters
-    tld = st.text(
-        alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ", min_size=2, max_size=10
-    )
+    tld = st.text(alphabet=ALPHA, min_size=2, max_size=10)
 
     local = draw(local_chars)
     domain = draw(domain_chars)
@@ -50,76 +103,54 @@ def email_addresses(draw):
 # Strategy for generating arbitrary field names
 field_names = st.one_of(
     st.just(""),  # Empty field name
-    st.text(alphabet="abcdefghijklmnopqrstuvwxyz_0123456789", min_size=1, max_size=30).filter(
-        lambda x: x[0].isalpha()
-    ),  # Start with letter
+    st.tuples(
+        st.sampled_from("abcdefghijklmnopqrstuvwxyz"),  # Start with letter
+        st.text(alphabet="abcdefghijklmnopqrstuvwxyz_0123456789", max_size=29),
+    ).map("".join),
 )
 
 
-class TestEmailDetectionProperties:
-    """Property-based tests for email detection."""
-
-    @settings(max_examples=15)
-    @given(email=email_addresses(), field_name=field_names)
-    def test_field_name_agnostic_email_detection(self, email: str, field_name: str):
-        """Feature: data-sanitizer, Property 4: Field-Name-Agnostic PII Detection (Email)
-
-        For any email value placed in any field name, the detector should
-        identify it as PII.
-
-        Validates: Requirements 2.1
-        """
-        detector = EmailDetector()
+# Text contexts an email is embedded in
+EMAIL_CONTEXT_TEMPLATES = (
+    "{email}",  # Just the email
+    "Contact: {email}",  # With prefix
+    "{email} for more info",  # With suffix
+    "Email {email} or call",  # In middle of text
+)
 
-        # Detect email in text with arbitrary field name
-        results = detector.detect(email, field_name=field_name)
 
-        # Assert: Email is detected regardless of field name
-        assert len(results) >= 1, f"Email '{email}' not detected in field '{field_name}'"
-        assert any(
-            result.pii_type == PIIType.EMAIL and result.original_value == email
-            for result in results
-        ), f"Email '{email}' not properly identified in field '{field_name}'"
+class TestEmailDetectionProperties:
+    """Property-based tests for email detection."""
 
-    @settings(max_examples=15)
+    @settings(FAST_SETTINGS, max_examples=15)
     @given(email=email_addresses())
-    def test_email_detection_in_text(self, email: str):
+    def test_email_detection_in_text(self, email_detector: EmailDetector, email: str):
         """Test that emails are detected when embedded in text.
 
         For any valid email, it should be detected even when surrounded
         by other text content.
         """
-        detector = EmailDetector()
-
         # Embed email in various text contexts
-        text_contexts = [
-            email,  # Just the email
-            f"Contact: {email}",  # With prefix
-            f"{email} for more info",  # With suffix
-            f"Email {email} or call",  # In middle of text
-        ]
-
-        for text in text_contexts:
-            results = detector.detect(text)
+        for template in EMAIL_CONTEXT_TEMPLATES:
+            text = template.format(email=email)
+            results = email_detector.detect(text)
             assert len(results) >= 1, f"Email '{email}' not detected in text: '{text}'"
             assert any(result.original_value == email for result in results), (
                 f"Email '{email}' not found in results for text: '{text}'"
             )
 
-    @settings(max_examples=15)
+    @settings(FAST_SETTINGS, max_examples=15)
     @given(email=email_addresses(), field_name1=field_names, field_name2=field_names)
     def test_consistent_detection_across_fields(
-        self, email: str, field_name1: str, field_name2: str
+        self, email_detector: EmailDetector, email: str, field_name1: str, field_name2: str
     ):
         """Test that the same email is detected consistently in different fields.
 
         For any email value, it should be detected with the same confidence
         and properties regardless of which field it appears in.
         """
-        detector = EmailDetector()
-
-        results1 = detector.detect(email, field_name=field_name1)
-        results2 = detector.detect(email, field_name=field_name2)
+        results1 = email_detector.detect(email, field_name=field_name1)
+        results2 = email_detector.detect(email, field_name=field_name2)
 
         # Both should detect the email
         assert len(results1) >= 1, f"Email not detected in field '{field_name1}'"
@@ -137,6 +168,17 @@ class TestEmailDetectionProperties:
         assert email_result1.confidence == email_result2.confidence
 
 
+# Phone format patterns and the templates that render them
+PHONE_FORMATS = [
+    ("international-dashes", "+{cc}-{area}-{prefix}-{line}"),
+    ("parentheses", "({area}) {prefix}-{line}"),
+    ("dashes", "{area}-{prefix}-{line}"),
+    ("plain", "{digits}"),
+    ("spaces", "{area} {prefix} {line}"),
+    ("dots", "{area}.{prefix}.{line}"),
+]
+
+
 # Strategy for generating phone numbers with various formats
 @st.composite
 def phone_numbers_with_format(draw):
@@ -152,120 +194,42 @@ def phone_numbers_with_format(draw):
     """
     # Generate 10-15 digit phone number
     digit_count = draw(st.integers(min_value=10, max_value=15))
-    digits = "".join([str(draw(st.integers(min_value=0, max_value=9))) for _ in range(digit_count)])
-
-    # Choose a format
-    format_choice = draw(st.integers(min_value=0, max_value=5))
-
-    if format_choice == 0 and len(digits) >= 10:
-        # International with dashes: +1-234-567-8900
-        country_code = digits[:1]
-        area = digits[1:4]
-        prefix = digits[4:7]
-        line = digits[7:11]
-        formatted = f"+{country_code}-{area}-{prefix}-{line}"
-        format_pattern = "international-dashes"
-    elif format_choice == 1 and len(digits) == 10:
-        # Parentheses format: (234) 567-8900
-        area = digits[:3]
-        prefix = digits[3:6]
-        line = digits[6:10]
-        formatted = f"({area}) {prefix}-{line}"
-        format_pattern = "parentheses"
-    elif format_choice == 2 and len(digits) == 10:
-        # Dashes format: 234-567-8900
-        area = digits[:3]
-        prefix = digits[3:6]
-        line = digits[6:10]
-        formatted = f"{area}-{prefix}-{line}"
-        format_pattern = "dashes"
-    elif format_choice == 3:
-        # Plain digits: 2345678900
-        formatted = digits
-        format_pattern = "plain"
-    elif format_choice == 4 and len(digits) >= 10:
-        # With spaces: 234 567 8900
-        area = digits[:3]
-        prefix = digits[3:6]
-        line = digits[6:10]
-        formatted = f"{area} {prefix} {line}"
-        format_pattern = "spaces"
-    else:
-        # With dots: 234.567.8900
-        if len(digits) >= 10:
-            area = digits[:3]
-            prefix = digits[3:6]
-            line = digits[6:10]
-            formatted = f"{area}.{prefix}.{line}"
-            format_pattern = "dots"
-        else:
-            formatted = digits
-            format_pattern = "plain"
-
-    return formatted, format_pattern
+    digits = draw(st.text(alphabet=DIGITS, min_size=digit_count, max_size=digit_count))
 
+    # Choose a format; every pattern is available for every digit count
+    format_pattern, template = draw(st.sampled_from(PHONE_FORMATS))
 
-# Strategy for generating names of different types
-@st.composite
-def names_with_type(draw):
-    """Generate names of different types for property testing.
+    area, prefix, line = digits[:3], digits[3:6], digits[6:10]
+    formatted = template.format(cc=digits[0], area=area, prefix=prefix, line=line, digits=digits)
 
-    Generates names in three categories:
-    - Full names: Two or more words (e.g., "John Doe", "Mary Jane Smith")
-    - First names: Single word with first_name field hint
-    - Last names: Single word with last_name field hint
+    return formatted, format_pattern
 
-    Returns:
-        Tuple of (name_text, expected_pii_type, field_name)
-    """
-    # Common first and last names for realistic generation
-    first_names = ["John", "Jane", "Michael", "Sarah", "David", "Emily", "Robert", "Lisa"]
-    last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis"]
-
-    # Choose name type
-    name_type = draw(st.integers(min_value=0, max_value=2))
-
-    if name_type == 0:
-        # Full name: 2-3 words
-        word_count = draw(st.integers(min_value=2, max_value=3))
-        first = draw(st.sampled_from(first_names))
-        last = draw(st.sampled_from(last_names))
-
-        if word_count == 2:
-            name_text = f"{first} {last}"
-        else:
-            middle = draw(st.sampled_from(first_names))
-            name_text = f"{first} {middle} {last}"
-
-        # Full names can be in various fields
-        field_name = draw(
-            st.sampled_from(["name", "full_name", "fullname", "customer", "employee", ""])
-        )
-        expected_type = PIIType.FULL_NAME
-
-    elif name_type == 1:
-        # First name: single word with first_name hint
-        name_text = draw(st.sampled_from(first_names))
-        field_name = draw(st.sampled_from(["first_name", "firstname", "fname", "givenname"]))
-        expected_type = PIIType.FIRST_NAME
-
-    else:
-        # Last name: single word with last_name hint
-        name_text = draw(st.sampled_from(last_names))
-        field_name = draw(
-            st.sampled_from(["last_name", "lastname", "lname", "surname", "familyname"])
-        )
-        expected_type = PIIType.LAST_NAME
 
-    return name_text, expected_type, field_name
+# Representative names of each type, with the field names they appear in
+NAME_CASES: list[tuple[str, PIIType, str]] = [
+    ("John Doe", PIIType.FULL_NAME, "name"),
+    ("Jane Smith", PIIType.FULL_NAME, "full_name"),
+    ("Michael Johnson", PIIType.FULL_NAME, "fullname"),
+    ("Sarah Emily Garcia", PIIType.FULL_NAME, "customer"),
+    ("David Williams", PIIType.FULL_NAME, "employee"),
+    ("Lisa Robert Davis", PIIType.FULL_NAME, ""),
+    ("John", PIIType.FIRST_NAME, "first_name"),
+    ("Emily", PIIType.FIRST_NAME, "firstname"),
+    ("Robert", PIIType.FIRST_NAME, "fname"),
+    ("Smith", PIIType.LAST_NAME, "last_name"),
+    ("Brown", PIIType.LAST_NAME, "surname"),
+    ("Miller", PIIType.LAST_NAME, "familyname"),
+]
 
 
 class TestPhoneDetectionProperties:
     """Property-based tests for phone number detection."""
 
-    @settings(max_examples=15)
+    @settings(FAST_SETTINGS, max_examples=15)
     @given(phone_data=phone_numbers_with_format())
-    def test_phone_format_preservation(self, phone_data: tuple[str, str]):
+    def test_phone_format_preservation(
+        self, phone_detector: PhoneDetector, phone_data: tuple[str, str]
+    ):
         """Feature: data-sanitizer, Property 9: Phone Format Preservation
 
         For any phone number with a specific format (with/without country code,
@@ -274,13 +238,10 @@ class TestPhoneDetectionProperties:
 
         Validates: Requirements 3.4
         """
-        from data_sanitizer.detectors.phone_detector import PhoneDetector
-
         phone, format_pattern = phone_data
-        detector = PhoneDetector()
 
         # Detect phone number
-        results = detector.detect(phone)
+        results = phone_detector.detect(phone)
 
         # Assert: Phone is detected
         assert len(results) >= 1, f"Phone '{phone}' with format '{format_pattern}' not detected"
@@ -312,42 +273,20 @@ class TestPhoneDetectionProperties:
             # Plain format should be all digits
             assert detected_phone.isdigit(), "Plain format should be all digits"
 
-    @settings(max_examples=15)
-    @given(phone_data=phone_numbers_with_format(), field_name=field_names)
-    def test_field_name_agnostic_phone_detection(
-        self, phone_data: tuple[str, str], field_name: str
-    ):
-        """Test that phone numbers are detected regardless of field name.
-
-        For any phone number placed in any field name, the detector should
-        identify it as PII.
-
-        Validates: Requirements 3.1
-        """
-        from data_sanitizer.detectors.phone_detector import PhoneDetector
-
-        phone, _ = phone_data
-        detector = PhoneDetector()
-
-        # Detect phone in text with arbitrary field name
-        results = detector.detect(phone, field_name=field_name)
-
-        # Assert: Phone is detected regardless of field name
-        assert len(results) >= 1, f"Phone '{phone}' not detected in field '{field_name}'"
-        assert any(
-            result.pii_type == PIIType.PHONE and result.original_value == phone
-            for result in results
-        ), f"Phone '{phone}' not properly identified in field '{field_name}'"
-
 
 class TestNameDetectionProperties:
     """Property-based tests for name detection."""
 
-    @settings(
-        max_examples=20, deadline=None
-    )  # Disabled deadline due to Presidio initialization time
-    @given(name_data=names_with_type())
-    def test_name_type_preservation(self, name_data: tuple[str, PIIType, str]):
+    # The name space is small enough to enumerate, so Presidio runs once per
+    # curated case instead of through Hypothesis generation and shrinking.
+    @pytest.mark.parametrize(("name_text", "expected_type", "field_name"), NAME_CASES)
+    def test_name_type_preservation(
+        self,
+        name_detector: NameDetector,
+        name_text: str,
+        expected_type: PIIType,
+        field_name: str,
+    ):
         """Feature: data-sanitizer, Property 10: Name Type Preservation
 
         For any detected name (full, first, or last), the replacement should
@@ -355,13 +294,8 @@ class TestNameDetectionProperties:
 
         Validates: Requirements 4.4
         """
-        from data_sanitizer.detectors.name_detector import NameDetector
-
-        name_text, expected_type, field_name = name_data
-        detector = NameDetector()
-
         # Detect name
-        results = detector.detect(name_text, field_name=field_name)
+        results = name_detector.detect(name_text, field_name=field_name)
 
         # Assert: Name is detected
         assert len(results) >= 1, f"Name '{name_text}' not detected in field '{field_name}'"
@@ -382,51 +316,8 @@ class TestNameDetectionProperties:
         )
 
 
-# Strategy for generating valid credit card numbers
-@st.composite
-def valid_credit_cards(draw):
-    """Generate valid credit card numbers for property testing.
-
-    Generates credit card numbers that pass Luhn algorithm validation.
-    Supports various card types:
-    - Visa: 16 digits starting with 4
-    - MasterCard: 16 digits starting with 51-55
-    - Amex: 15 digits starting with 34 or 37
-    - Discover: 16 digits starting with 6011
-
-    Returns:
-        Valid credit card number as a string
-    """
-    # Choose card type
-    card_type = draw(st.sampled_from(["visa", "mastercard", "amex", "discover"]))
-
-    if card_type == "visa":
-        # Visa: 16 digits starting with 4
-        prefix = "4"
-        remaining_length = 15
-    elif card_type == "mastercard":
-        # MasterCard: 16 digits starting with 51-55
-        prefix = str(draw(st.integers(min_value=51, max_value=55)))
-        remaining_length = 14
-    elif card_type == "amex":
-        # Amex: 15 digits starting with 34 or 37
-        prefix = draw(st.sampled_from(["34", "37"]))
-        remaining_length = 13
-    else:  # discover
-        # Discover: 16 digits starting with 6011
-        prefix = "6011"
-        remaining_length = 12
-
-    # Generate random digits for the rest (except check digit)
-    middle_digits = "".join(
-        [str(draw(st.integers(min_value=0, max_value=9))) for _ in range(remaining_length - 1)]
-    )
-
-    # Calculate Luhn check digit
-    partial_number = prefix + middle_digits
-    check_digit = _calculate_luhn_check_digit(partial_number)
-
-    return partial_number + str(check_digit)
+# Luhn doubling of each digit, with 9 already subtracted from results above 9
+DOUBLED = bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9])
 
 
 def _calculate_luhn_check_digit(partial_number: str) -> int:
@@ -438,30 +329,66 @@ def _calculate_luhn_check_digit(partial_number: str) -> int:
     Returns:
         The check digit (0-9) that makes the number valid
     """
-    # Convert to list of integers, reversed
-    digits = [int(d) for d in partial_number[::-1]]
+    digits = bytes(int(d) for d in partial_number)
 
-    # Double every second digit (starting from index 0, which is second from right)
-    for i in range(0, len(digits), 2):
-        digits[i] *= 2
-        if digits[i] > 9:
-            digits[i] -= 9
-
-    # Calculate sum
-    total = sum(digits)
+    # Once the check digit is appended, the rightmost digit here becomes the
+    # second from the right, so it and every other digit leftwards are doubled
+    doubled_sum = sum(DOUBLED[d] for d in digits[-1::-2])
+    plain_sum = sum(digits[-2::-2])
 
     # Check digit is what we need to add to make total divisible by 10
-    check_digit = (10 - (total % 10)) % 10
+    return (10 - (doubled_sum + plain_sum) % 10) % 10
+
 
-    return check_digit
+# Card prefixes and total lengths per card type:
+# - Visa: 16 digits starting with 4
+# - MasterCard: 16 digits starting with 51-55
+# - Amex: 15 digits starting with 34 or 37
+# - Discover: 16 digits starting with 6011
+CARD_TYPES = [
+    (["4"], 16),
+    (["51", "52", "53", "54", "55"], 16),
+    (["34", "37"], 15),
+    (["6011"], 16),
+]
+
+
+def _generate_valid_card_corpus(count: int, seed: int = 0) -> list[str]:
+    """Generate valid credit card numbers for property testing.
+
+    Cycles through the card types in CARD_TYPES, filling each number with
+    seeded random digits and a computed Luhn check digit.
+
+    Args:
+        count: Number of card numbers to generate
+        seed: Seed for the random digit source, so the corpus is reproducible
+
+    Returns:
+        List of card numbers that pass Luhn algorithm validation
+    """
+    rng = random.Random(seed)
+    cards = []
+    for i in range(count):
+        prefixes, length = CARD_TYPES[i % len(CARD_TYPES)]
+        prefix = rng.choice(prefixes)
+        middle_digits = "".join(rng.choices(DIGITS, k=length - len(prefix) - 1))
+        partial_number = prefix + middle_digits
+        cards.append(partial_number + str(_calculate_luhn_check_digit(partial_number)))
+    return cards
+
+
+# Valid card numbers are built once at import; Hypothesis only samples them
+VALID_CARDS = _generate_valid_card_corpus(256)
 
 
 class TestCreditCardDetectionProperties:
     """Property-based tests for credit card detection."""
 
-    @settings(max_examples=15)
-    @given(card_number=valid_credit_cards())
-    def test_credit_card_replacement_validity(self, card_number: str):
+    @settings(FAST_SETTINGS, max_examples=15)
+    @given(card_number=st.sampled_from(VALID_CARDS))
+    def test_credit_card_replacement_validity(
+        self, credit_card_detector: CreditCardDetector, card_number: str
+    ):
         """Feature: data-sanitizer, Property 14: Credit Card Replacement Validity
 
         For any detected credit card number, the replacement should be a valid
@@ -473,17 +400,13 @@ class TestCreditCardDetectionProperties:
 
         Validates: Requirements 5.2
         """
-        from data_sanitizer.detectors.credit_card_detector import CreditCardDetector
-
-        detector = CreditCardDetector()
-
         # Verify the generated card passes Luhn validation
-        assert detector._luhn_check(card_number), (
+        assert credit_card_detector._luhn_check(card_number), (
             f"Generated card '{card_number}' should pass Luhn validation"
         )
 
         # Detect the credit card
-        results = detector.detect(card_number)
+        results = credit_card_detector.detect(card_number)
 
         # Assert: Credit card is detected
         assert len(results) >= 1, f"Credit card '{card_number}' not detected"
@@ -507,26 +430,47 @@ class TestCreditCardDetectionProperties:
             f"Expected confidence 1.0 for valid card, got {detected_result.confidence}"
         )
 
-    @settings(max_examples=15)
-    @given(card_number=valid_credit_cards(), field_name=field_names)
-    def test_field_name_agnostic_credit_card_detection(self, card_number: str, field_name: str):
-        """Test that credit cards are detected regardless of field name.
 
-        For any credit card number placed in any field name, the detector
-        should identify it as PII.
+class TestFieldNameAgnosticDetectionProperties:
+    """Property-based tests for field-name-agnostic detection."""
 
-        Validates: Requirements 5.1
-        """
-        from data_sanitizer.detectors.credit_card_detector import CreditCardDetector
+    @pytest.mark.parametrize(
+        ("strategy", "detector_fixture", "pii_type"),
+        [
+            (email_addresses(), "email_detector", PIIType.EMAIL),
+            (phone_numbers_with_format().map(lambda t: t[0]), "phone_detector", PIIType.PHONE),
+            (st.sampled_from(VALID_CARDS), "credit_card_detector", PIIType.CREDIT_CARD),
+        ],
+        ids=["email", "phone", "credit_card"],
+    )
+    @settings(FAST_SETTINGS, max_examples=15)
+    @given(data=st.data())
+    def test_field_name_agnostic_detection(
+        self,
+        request: pytest.FixtureRequest,
+        strategy: st.SearchStrategy[str],
+        detector_fixture: str,
+        pii_type: PIIType,
+        data: st.DataObject,
+    ):
+        """Feature: data-sanitizer, Property 4: Field-Name-Agnostic PII Detection
+
+        For any email, phone number, or credit card value placed in any field
+        name, the matching detector should identify it as PII.
 
-        detector = CreditCardDetector()
+        Validates: Requirements 2.1, 3.1, 5.1
+        """
+        detector = request.getfixturevalue(detector_fixture)
+        value = data.draw(strategy, label="value")
+        field_name = data.draw(field_names, label="field_name")
 
-        # Detect card in text with arbitrary field name
-        results = detector.detect(card_number, field_name=field_name)
+        # Detect value in text with arbitrary field name
+        results = detector.detect(value, field_name=field_name)
 
-        # Assert: Card is detected regardless of field name
-        assert len(results) >= 1, f"Card '{card_number}' not detected in field '{field_name}'"
-        assert any(
-            result.pii_type == PIIType.CREDIT_CARD and result.original_value == card_number
-            for result in results
-        ), f"Card '{card_number}' not properly identified in field '{field_name}'"
+        # Assert: Value is detected as the expected type regardless of field name
+        matched = next(
+            (r for r in results if r.pii_type == pii_type and r.original_value == value), None
+        )
+        assert matched is not None, (
+            f"'{value}' not identified as {pii_type} in field '{field_name}': {results}"
+        )
@@ -32,6 +32,31 @@ class TestParseArguments:
             assert args.output_file == "output.json"
             assert args.verbose is True
 
+    def test_parse_workers_option(self):
+        """Test parsing --workers, which defaults to a single process."""
+        with patch("sys.argv", ["data-sanitizer", "input.json", "output.json"]):
+            assert parse_arguments().workers == 1
+
+        with patch("sys.argv", ["data-sanitizer", "in.json", "out.json", "--workers", "4"]):
+            assert parse_arguments().workers == 4
+
+    def test_parse_with_no_names_flag(self):
+        """Test parsing --no-names, which is off by default."""
+        with patch("sys.argv", ["data-sanitizer", "input.json", "output.json"]):
+            assert parse_arguments().no_names is False
+
+        with patch("sys.argv", ["data-sanitizer", "input.json", "output.json", "--no-names"]):
+            assert parse_arguments().no_names is True
+
+    def test_parse_explicit_argv(self):
+        """Test that an explicit argv is parsed instead of sys.argv."""
+        with patch("sys.argv", ["data-sanitizer"]):
+            args = parse_arguments(["input.json", "output.json", "--no-names"])
+
+        assert args.input_file == "input.json"
+        assert args.output_file == "output.json"
+        assert args.no_names is True
+
     def test_parse_missing_arguments(self):
         """Test that missing required arguments causes SystemExit."""
         with patch("sys.argv", ["data-sanitizer"]):
@@ -129,6 +154,28 @@ class TestMainFunction:
             input_path.unlink(missing_ok=True)
             output_path.unlink(missing_ok=True)
 
+    def test_main_with_no_names_flag(self):
+        """Test that --no-names sanitizes without creating a NameDetector."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "input.json"
+            output_path = Path(tmpdir) / "output.json"
+            input_path.write_text(json.dumps([{"name": "John Doe", "email": "john@example.com"}]))
+
+            argv = ["data-sanitizer", str(input_path), str(output_path), "--verbose", "--no-names"]
+            with patch("sys.argv", argv):
+                captured_output = StringIO()
+                with patch("sys.stdout", captured_output):
+                    exit_code = main()
+
+            assert exit_code == 0
+            output = captured_output.getvalue()
+            assert "EmailDetector" in output
+            assert "NameDetector" not in output
+
+            output_data = json.loads(output_path.read_text())
+            assert output_data[0]["name"] == "John Doe"
+            assert output_data[0]["email"] != "john@example.com"
+
     def test_main_file_not_found(self):
         """Test main function with non-existent input file."""
         input_path = "nonexistent_file.json"
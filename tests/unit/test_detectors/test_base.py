@@ -98,3 +98,46 @@ def test_concrete_detector_returns_detection_results() -> None:
     # Test without PII
     results = detector.detect("no pii here", "text")
     assert len(results) == 0
+
+
+def test_default_detect_batch_calls_detect_per_item() -> None:
+    """Test that the default detect_batch() returns detect() results per item.
+
+    Detectors that do not opt into batching still work with the batch API,
+    and report supports_batch as False.
+    """
+
+    class EchoDetector(Detector):
+        """A detector that flags texts equal to 'pii'."""
+
+        def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
+            """Return one detection if the text is 'pii'."""
+            if text == "pii":
+                return [DetectionResult(PIIType.EMAIL, text, 1.0, 0, len(text))]
+            return []
+
+    detector = EchoDetector()
+    results = detector.detect_batch([("pii", "a"), ("clean", "b")])
+
+    assert detector.supports_batch is False
+    assert len(results) == 2
+    assert len(results[0]) == 1
+    assert results[1] == []
+
+
+def test_default_iter_detect_iterates_over_detect() -> None:
+    """Test that the default iter_detect() yields the detect() results."""
+
+    class EchoDetector(Detector):
+        """A detector that flags texts equal to 'pii'."""
+
+        def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
+            """Return one detection if the text is 'pii'."""
+            if text == "pii":
+                return [DetectionResult(PIIType.EMAIL, text, 1.0, 0, len(text))]
+            return []
+
+    detector = EchoDetector()
+
+    assert list(detector.iter_detect("pii")) == detector.detect("pii")
+    assert list(detector.iter_detect("clean")) == []
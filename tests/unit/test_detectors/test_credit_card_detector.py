@@ -185,3 +185,8 @@ class TestCreditCardDetector:
         assert results[0].start_pos == 13
         assert results[0].end_pos == 29
         assert text[results[0].start_pos : results[0].end_pos] == "4532015112830366"
+
+    def test_no_detection_without_four_digit_run(self, detector):
+        """Test that texts with only short digit runs are not detected."""
+        assert detector.detect("Order 12 of 300 shipped to room 42 on day 5") == []
+        assert detector.detect("453 201 511 283 036 6") == []
@@ -94,6 +94,11 @@ class TestEmailDetector:
             results = detector.detect(text)
             assert len(results) == 0, f"Should not detect: {text}"
 
+    def test_no_detection_pipe_in_domain(self, detector):
+        """Test that "|" is not accepted as part of the domain or TLD."""
+        assert detector.detect("user@foo|bar.com") == []
+        assert detector.detect("user@example.c|om") == []
+
     def test_detect_multiple_emails(self, detector):
         """Test detection of multiple emails in same text."""
         text = "Contact john@example.com or jane@test.org for help"
@@ -154,3 +159,18 @@ class TestEmailDetector:
         """Test detection handles non-string input gracefully."""
         results = detector.detect(None)
         assert len(results) == 0
+
+    def test_scan_start(self, detector):
+        """Test that scanning starts at the local part before the first "@"."""
+        assert detector.scan_start("no email here") == -1
+        assert detector.scan_start("说明 Contact: first.last@example.com") == 12
+        assert detector.scan_start("@example.com") == 0
+
+    def test_detect_after_long_non_ascii_prefix(self, detector):
+        """Test detection of an email at the end of a long non-ASCII field."""
+        text = "很长的描述。" * 200 + "mail jane.doe@example.com"
+        results = detector.detect(text)
+
+        assert len(results) == 1
+        assert results[0].original_value == "jane.doe@example.com"
+        assert text[results[0].start_pos : results[0].end_pos] == "jane.doe@example.com"
@@ -0,0 +1,136 @@
+"""Unit tests for MultiRegexDetector.
+
+This module tests the combined regex detector, including:
+- Detection of each PII type through the fused pattern
+- Validation dispatch (Luhn for cards, digit count for phones)
+- Agreement with the standalone regex detectors
+- Non-overlapping results for values matching several patterns
+"""
+
+import pytest
+
+from data_sanitizer.detectors.credit_card_detector import CreditCardDetector
+from data_sanitizer.detectors.email_detector import EmailDetector
+from data_sanitizer.detectors.multi_regex_detector import MultiRegexDetector
+from data_sanitizer.detectors.phone_detector import PhoneDetector
+from data_sanitizer.models import PIIType
+
+
+class TestMultiRegexDetector:
+    """Test suite for MultiRegexDetector."""
+
+    @pytest.fixture
+    def detector(self):
+        """Create a MultiRegexDetector instance for testing."""
+        return MultiRegexDetector()
+
+    def test_detect_email(self, detector):
+        """Test detection of an email address."""
+        results = detector.detect("Contact john.doe@example.com today")
+
+        assert len(results) == 1
+        assert results[0].pii_type == PIIType.EMAIL
+        assert results[0].original_value == "john.doe@example.com"
+
+    def test_detect_credit_card(self, detector):
+        """Test detection of a Luhn-valid credit card."""
+        results = detector.detect("Card: 4532-0151-1283-0366")
+
+        assert len(results) == 1
+        assert results[0].pii_type == PIIType.CREDIT_CARD
+        assert results[0].original_value == "4532-0151-1283-0366"
+
+    def test_detect_phone(self, detector):
+        """Test detection of a phone number."""
+        results = detector.detect("Call (555) 123-4567")
+
+        assert len(results) == 1
+        assert results[0].pii_type == PIIType.PHONE
+        assert results[0].original_value == "(555) 123-4567"
+
+    def test_detect_mixed_pii_in_order(self, detector):
+        """Test that mixed PII is detected once per value, ordered by position."""
+        text = "Email john@example.com, call 555-123-4567, card 4532015112830366"
+        results = detector.detect(text)
+
+        assert [r.pii_type for r in results] == [
+            PIIType.EMAIL,
+            PIIType.PHONE,
+            PIIType.CREDIT_CARD,
+        ]
+        for result in results:
+            assert text[result.start_pos : result.end_pos] == result.original_value
+
+    def test_amex_reported_once_as_credit_card(self, detector):
+        """Test that a 15-digit card is not also reported as a phone number."""
+        results = detector.detect("378282246310005")
+
+        assert len(results) == 1
+        assert results[0].pii_type == PIIType.CREDIT_CARD
+
+    def test_invalid_card_falls_back_to_phone(self, detector):
+        """Test that a Luhn-invalid digit run can still be detected as a phone."""
+        results = detector.detect("Ref 123456789012345")
+
+        assert len(results) == 1
+        assert results[0].pii_type == PIIType.PHONE
+        assert results[0].original_value == "123456789012345"
+
+    def test_no_detection_invalid_values(self, detector):
+        """Test that values failing validation are not detected."""
+        assert detector.detect("Invalid card: 1234567890123456") == []
+        assert detector.detect("Call 123-4567 for info") == []
+        assert detector.detect("user@domain") == []
+
+    def test_matches_standalone_detectors(self, detector):
+        """Test agreement with the standalone detectors on single-PII texts."""
+        standalone = [EmailDetector(), CreditCardDetector(), PhoneDetector()]
+        texts = [
+            "user+tag@example.co.uk",
+            "4532 0151 1283 0366",
+            "+1-555-123-4567",
+            "234 567 8900",
+            "Call 12345678901",
+        ]
+
+        for text in texts:
+            expected = [r for d in standalone for r in d.detect(text)]
+            assert detector.detect(text) == expected, text
+
+    def test_ascii_and_non_ascii_text_detect_alike(self, detector):
+        """Test that the bytes scan for ASCII text matches the str scan."""
+        ascii_text = "Mail a@b.co, card 4532\x1c0151\x1c1283\x1c0366, call 555-123-4567"
+        results = detector.detect(ascii_text)
+        non_ascii_results = detector.detect("é" + ascii_text)
+
+        assert [r.pii_type for r in results] == [
+            PIIType.EMAIL,
+            PIIType.CREDIT_CARD,
+            PIIType.PHONE,
+        ]
+        assert [r.original_value for r in non_ascii_results] == [r.original_value for r in results]
+        assert [r.start_pos for r in non_ascii_results] == [r.start_pos + 1 for r in results]
+
+    def test_detect_empty_string(self, detector):
+        """Test detection on empty string."""
+        assert detector.detect("") == []
+
+    def test_detect_non_string_input(self, detector):
+        """Test detection handles non-string input gracefully."""
+        assert detector.detect(None) == []
+
+    def test_hyperscan_prefilter_matches_regex_scan(self, detector):
+        """Test that the optional Hyperscan prefilter never hides detections."""
+        pytest.importorskip("hyperscan")
+        regex_only = MultiRegexDetector()
+        regex_only._hyperscan_database = None
+        texts = [
+            "no pii, just 12 apples",
+            "Reach me at jane@example.org",
+            "Card\x1c4532\x1c0151\x1c1283\x1c0366",
+            "Call 555-123-4567 or 4532015112830366",
+            "Übersicht: 555-123-4567",
+        ]
+
+        for text in texts:
+            assert detector.detect(text) == regex_only.detect(text), text
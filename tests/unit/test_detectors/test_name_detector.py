@@ -264,6 +264,14 @@ class TestNameDetector:
         results = detector.detect(None)
         assert len(results) == 0
 
+    def test_detect_skips_analyzer_without_letters(self, detector, monkeypatch):
+        """Test that texts without letters never reach the NLP analyzer."""
+        monkeypatch.setattr(detector.analyzer, "analyze", pytest.fail)
+        items = [("2024-01-01 12:30", "notes"), ("+1 (555) 123-4567", "name")]
+
+        assert detector.detect("$1,234.56") == []
+        assert detector.detect_batch(items) == [[], []]
+
     def test_detect_no_names_in_text(self, detector):
         """Test detection returns empty list when no names present."""
         text = "The quick brown fox jumps over the lazy dog"
@@ -293,3 +301,31 @@ class TestNameDetector:
             # Presidio might detect this as one or multiple entities
             # We just verify it's detected
             assert any(r.pii_type == PIIType.FULL_NAME for r in results)
+
+    def test_determine_name_type_without_hint_counts_words(self, detector):
+        """Test that names split by any whitespace are classified as FULL_NAME."""
+        assert detector._determine_name_type("Jane\tDoe", "contact") == PIIType.FULL_NAME
+        assert detector._determine_name_type(" Jane ", "contact") == PIIType.FIRST_NAME
+        assert detector._determine_name_type("Jane Doe", "Last-Name") == PIIType.LAST_NAME
+
+    def test_analyzer_shared_across_instances(self, detector):
+        """Test that new instances reuse the already-loaded Presidio analyzer."""
+        other = NameDetector()
+
+        assert other.analyzer is detector.analyzer
+
+    def test_detect_batch_matches_detect(self, detector):
+        """Test that batched detection returns the same results as detect()."""
+        items = [
+            ("John Doe", "name"),
+            ("", "name"),
+            ("Jane", "first_name"),
+            ("no names here", "notes"),
+        ]
+
+        batch_results = detector.detect_batch(items)
+
+        assert detector.supports_batch is True
+        assert len(batch_results) == len(items)
+        for (text, field_name), results in zip(items, batch_results, strict=True):
+            assert results == detector.detect(text, field_name)
@@ -227,3 +227,10 @@ class TestPhoneDetector:
 
         assert len(results) == 1
         assert results[0].original_value == "1234567890"
+
+    def test_is_valid_counts_ascii_and_unicode_digits(self, detector):
+        """Test the digit count check for ASCII and non-ASCII candidates."""
+        assert detector.is_valid("+1 (555) 123-4567") is True
+        assert detector.is_valid("555-1234") is False
+        assert detector.is_valid("1234567890123456") is False
+        assert detector.is_valid("٠١٢٣٤٥٦٧٨٩") is True
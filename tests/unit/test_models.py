@@ -79,6 +79,14 @@ class TestDetectionResult:
         assert result.start_pos == 10
         assert result.end_pos == 26
 
+    def test_uses_slots(self) -> None:
+        """Test that instances have no per-instance __dict__."""
+        result = DetectionResult(
+            pii_type=PIIType.EMAIL, original_value="test@example.com", confidence=0.95
+        )
+
+        assert not hasattr(result, "__dict__")
+
     def test_field_access(self) -> None:
         """Test accessing individual fields."""
         result = DetectionResult(
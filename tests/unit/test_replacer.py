@@ -3,7 +3,7 @@
 import re
 
 from data_sanitizer.models import DetectionResult, PIIType
-from data_sanitizer.replacer import Replacer
+from data_sanitizer.replacer import Replacer, _classify_phone_format, _PhoneFormat
 
 
 class TestReplacerEmailGeneration:
@@ -107,6 +107,14 @@ class TestReplacerPhoneGeneration:
 
         assert fake1 == fake2, "Same phone should map to same fake phone"
 
+    def test_classify_phone_format(self) -> None:
+        """Test that phone layouts are classified in precedence order."""
+        assert _classify_phone_format("(555) 123-4567") == _PhoneFormat.PARENTHESES
+        assert _classify_phone_format("555-123-4567") == _PhoneFormat.DASHED
+        assert _classify_phone_format("+1-555-123-4567") == _PhoneFormat.INTERNATIONAL
+        assert _classify_phone_format("5551234567") == _PhoneFormat.DIGITS_ONLY
+        assert _classify_phone_format("555.123.4567") == _PhoneFormat.OTHER
+
 
 class TestReplacerNameGeneration:
     """Tests for name generation with case preservation."""
@@ -298,3 +306,10 @@ class TestReplacerConsistencyCache:
         # But same input should always give same output (cache consistency)
         fake1_again = replacer.replace(detection1)
         assert fake1 == fake1_again, "Same input should produce same output"
+
+    def test_every_pii_type_has_a_generator(self) -> None:
+        """Test that no known PII type falls back to the redaction placeholder."""
+        replacer = Replacer(seed=42)
+
+        for pii_type in PIIType:
+            assert replacer.get_or_create_replacement("Jane 555-123-4567", pii_type) != "[REDACTED]"
@@ -2,13 +2,18 @@
 
 import json
 import tempfile
+from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 from data_sanitizer.detectors.base import Detector
+from data_sanitizer.detectors.email_detector import EmailDetector
+from data_sanitizer.detectors.phone_detector import PhoneDetector
 from data_sanitizer.exceptions import (
     FileNotFoundError,
+    InvalidOutputPathError,
     JSONParseError,
 )
 from data_sanitizer.models import DetectionResult, PIIType
@@ -39,6 +44,55 @@ class MockDetector(Detector):
         return []
 
 
+class BatchMockDetector(MockDetector):
+    """Mock batch-capable detector that records how it was called."""
+
+    supports_batch = True
+
+    def __init__(self, pattern: str, pii_type: PIIType):
+        super().__init__(pattern, pii_type)
+        self.detect_calls = 0
+        self.batch_calls: list[list[tuple[str, str]]] = []
+
+    def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
+        """Detect the mock pattern in text, counting calls."""
+        self.detect_calls += 1
+        return super().detect(text, field_name)
+
+    def detect_batch(self, items: list[tuple[str, str]]) -> list[list[DetectionResult]]:
+        """Detect the mock pattern in all items, recording the batch."""
+        self.batch_calls.append(list(items))
+        return [MockDetector.detect(self, text, field_name) for text, field_name in items]
+
+
+class FixedDetector(Detector):
+    """Detector that reports the same detection for every text."""
+
+    def __init__(self, result: DetectionResult):
+        self.result = result
+
+    def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
+        """Return the fixed detection."""
+        return [self.result]
+
+
+class StrictTypeDetector(Detector):
+    """Detector that records every value the sanitizer hands to it."""
+
+    def __init__(self):
+        self.seen: list[object] = []
+
+    def detect(self, text: str, field_name: str = "") -> list[DetectionResult]:
+        """Record the text and detect nothing."""
+        self.seen.append(text)
+        return []
+
+    def iter_detect(self, text: str, field_name: str = "") -> Iterator[DetectionResult]:
+        """Record the text and detect nothing, without a type check."""
+        self.seen.append(text)
+        return iter([])
+
+
 class TestSanitizerInit:
     """Tests for Sanitizer initialization."""
 
@@ -52,6 +106,15 @@ class TestSanitizerInit:
         assert sanitizer._detectors == detectors
         assert sanitizer._replacer == replacer
 
+    def test_init_rejects_unknown_field_detectors(self):
+        """Test that field detector subsets must come from the detector list."""
+        with pytest.raises(ValueError):
+            Sanitizer(
+                [EmailDetector()],
+                Replacer(seed=42),
+                field_detectors={"phone": [PhoneDetector()]},
+            )
+
 
 class TestSanitizeValue:
     """Tests for sanitize_value method."""
@@ -160,6 +223,64 @@ class TestSanitizeValue:
         assert result[1]["name"] == "clean"
         assert result[1]["id"] == 2
 
+    def test_sanitize_subclasses_of_json_types(self):
+        """Test that str, dict, and list subclasses are sanitized like their bases."""
+        detector = MockDetector("secret", PIIType.EMAIL)
+        replacer = Replacer(seed=42)
+        sanitizer = Sanitizer([detector], replacer)
+
+        class TaggedStr(str):
+            pass
+
+        class TaggedList(list):
+            pass
+
+        value = OrderedDict(items=TaggedList([TaggedStr("secret")]))
+
+        result = sanitizer.sanitize_value(value, "data")
+
+        assert "secret" not in result["items"][0]
+
+    def test_sanitize_string_replaces_every_occurrence_in_order(self):
+        """Test that several detections in one string are all replaced in place."""
+        sanitizer = Sanitizer([EmailDetector(), PhoneDetector()], Replacer(seed=42))
+
+        result = sanitizer.sanitize_value("a@b.co, 555-123-4567 and c@d.org!", "notes")
+
+        assert "a@b.co" not in result
+        assert "c@d.org" not in result
+        assert "555-123-4567" not in result
+        assert result.endswith("!")
+        assert sanitizer._pii_replacements_made == 3
+
+    def test_sanitize_string_replaces_overlapping_detections_once(self):
+        """Test that overlapping detections keep the higher-confidence one."""
+
+        text = "Call Jane Doe now"
+        name = DetectionResult(PIIType.FULL_NAME, "Jane Doe", 0.85, 5, 13)
+        first = DetectionResult(PIIType.FIRST_NAME, "Jane", 0.6, 5, 9)
+        sanitizer = Sanitizer([FixedDetector(first), FixedDetector(name)], Replacer(seed=42))
+
+        result = sanitizer.sanitize_value(text, "notes")
+
+        assert result.startswith("Call ")
+        assert result.endswith(" now")
+        assert "Jane" not in result
+        assert sanitizer._pii_replacements_made == 1
+
+    def test_sanitize_string_prefers_longer_span_at_equal_confidence(self):
+        """Test that duplicate and shorter overlapping spans are dropped."""
+        full = DetectionResult(PIIType.FULL_NAME, "Jane Doe", 0.85, 5, 13)
+        first = DetectionResult(PIIType.FIRST_NAME, "Jane", 0.85, 5, 9)
+        detectors = [FixedDetector(first), FixedDetector(full), FixedDetector(full)]
+        sanitizer = Sanitizer(detectors, Replacer(seed=42))
+
+        result = sanitizer.sanitize_value("Call Jane Doe now", "notes")
+
+        assert "Jane" not in result
+        assert sanitizer._pii_replacements_made == 1
+        assert sanitizer._replacer._cache[PIIType.FIRST_NAME] == {}
+
 
 class TestSanitizeRecords:
     """Tests for sanitize_records method."""
@@ -211,6 +332,149 @@ class TestSanitizeRecords:
 
         assert result == []
 
+    def test_batch_detector_called_once_for_all_strings(self):
+        """Test that batch-capable detectors analyze all strings in one call."""
+        detector = BatchMockDetector("secret", PIIType.EMAIL)
+        replacer = Replacer(seed=42)
+        sanitizer = Sanitizer([detector], replacer)
+
+        records = [
+            {"name": "secret", "tags": ["secret", "clean"], "age": 30},
+            {"profile": {"name": "secret"}},
+        ]
+
+        result = sanitizer.sanitize_records(records)
+
+        assert len(detector.batch_calls) == 1
+        assert detector.detect_calls == 0
+        # Unique (text, field_name) pairs only, in traversal order
+        assert detector.batch_calls[0] == [
+            ("secret", "name"),
+            ("secret", "tags"),
+            ("clean", "tags"),
+        ]
+        assert "secret" not in result[0]["name"]
+        assert "secret" not in result[0]["tags"][0]
+        assert result[0]["tags"][1] == "clean"
+        assert result[1]["profile"]["name"] == result[0]["name"]
+
+    def test_batch_detections_cleared_after_records(self):
+        """Test that batch results do not leak into later sanitize_value calls."""
+        detector = BatchMockDetector("secret", PIIType.EMAIL)
+        replacer = Replacer(seed=42)
+        sanitizer = Sanitizer([detector], replacer)
+
+        sanitizer.sanitize_records([{"name": "secret"}])
+        result = sanitizer.sanitize_value("another secret", "note")
+
+        assert "secret" not in result
+        assert detector.detect_calls == 1
+
+    def test_detectors_only_receive_strings(self):
+        """Test that non-string values never reach the detectors."""
+        detector = StrictTypeDetector()
+        sanitizer = Sanitizer([detector], Replacer(seed=42))
+
+        records = [
+            {"id": 1, "score": 9.5, "active": True, "notes": None},
+            {"tags": ["a", 2, None, {"nested": "b", "count": 3}]},
+        ]
+        result = sanitizer.sanitize_records(records)
+
+        assert result == records
+        assert detector.seen
+        assert all(isinstance(text, str) for text in detector.seen)
+
+    def test_repeated_strings_are_scanned_once(self):
+        """Test that repeated values reuse the cached result and still count."""
+        detector = BatchMockDetector("secret", PIIType.EMAIL)
+        sanitizer = Sanitizer([detector], Replacer(seed=42))
+
+        first = sanitizer.sanitize_value("my secret", "note")
+        second = sanitizer.sanitize_value("my secret", "note")
+
+        assert second == first
+        assert detector.detect_calls == 1
+        assert sanitizer._pii_fields_detected == 2
+        assert sanitizer._pii_replacements_made == 2
+
+    def test_string_cache_is_bounded(self):
+        """Test that the least recently used strings are evicted."""
+        sanitizer = Sanitizer([MockDetector("secret", PIIType.EMAIL)], Replacer(seed=42))
+        sanitizer.STRING_CACHE_SIZE = 2
+
+        for text in ["a", "b", "a", "c"]:
+            sanitizer.sanitize_value(text, "note")
+
+        assert list(sanitizer._string_cache) == [("a", "note"), ("c", "note")]
+
+    def test_skip_fields_are_not_scanned(self):
+        """Test that strings under skipped field names bypass detection."""
+        detector = BatchMockDetector("secret", PIIType.EMAIL)
+        sanitizer = Sanitizer([detector], Replacer(seed=42), skip_fields=["status"])
+
+        records = [{"status": "secret", "tags": ["secret"], "meta": {"status": "secret"}}]
+        result = sanitizer.sanitize_records(records)
+
+        assert result[0]["status"] == "secret"
+        assert result[0]["meta"]["status"] == "secret"
+        assert "secret" not in result[0]["tags"][0]
+        assert detector.batch_calls == [[("secret", "tags")]]
+
+    def test_field_detectors_restrict_detection(self):
+        """Test that a field's detector subset replaces the full detector list."""
+        email = EmailDetector()
+        batch = BatchMockDetector("secret", PIIType.EMAIL)
+        sanitizer = Sanitizer(
+            [email, batch], Replacer(seed=42), field_detectors={"contact": [email]}
+        )
+
+        records = [{"contact": "secret a@b.co", "note": "secret a@b.co"}]
+        result = sanitizer.sanitize_records(records)
+
+        assert result[0]["contact"].startswith("secret ")
+        assert "a@b.co" not in result[0]["contact"]
+        assert "secret" not in result[0]["note"]
+        assert "a@b.co" not in result[0]["note"]
+        assert batch.batch_calls == [[("secret a@b.co", "note")]]
+
+    def test_parallel_detection_honors_field_detectors(self):
+        """Test that worker processes run only each field's detector subset."""
+        email = EmailDetector()
+        phone = PhoneDetector()
+        records = [
+            {"contact": f"u{i}@b.co 555-123-4567", "note": "555-123-4567"} for i in range(10)
+        ]
+        serial = Sanitizer([email, phone], Replacer(seed=42), field_detectors={"contact": [email]})
+        expected = serial.sanitize_records(records)
+
+        parallel = Sanitizer(
+            [email, phone], Replacer(seed=42), workers=2, field_detectors={"contact": [email]}
+        )
+        parallel.PARALLEL_CHUNK_SIZE = 4
+        result = parallel.sanitize_records(records)
+
+        assert result == expected
+        assert all(record["contact"].endswith(" 555-123-4567") for record in result)
+        assert all(record["note"] != "555-123-4567" for record in result)
+
+    def test_parallel_detection_matches_serial(self):
+        """Test that detecting in worker processes gives the same output."""
+        records = [
+            {"email": f"user{i}@example.com", "phone": "555-123-4567", "note": f"n{i}"}
+            for i in range(10)
+        ]
+        serial = Sanitizer([EmailDetector(), PhoneDetector()], Replacer(seed=42))
+        expected = serial.sanitize_records(records)
+
+        parallel = Sanitizer([EmailDetector(), PhoneDetector()], Replacer(seed=42), workers=2)
+        parallel.PARALLEL_CHUNK_SIZE = 4
+        result = parallel.sanitize_records(records)
+
+        assert result == expected
+        assert parallel._pii_replacements_made == serial._pii_replacements_made
+        assert parallel._batch_detections == {}
+
 
 class TestSanitizeFile:
     """Tests for sanitize_file method."""
@@ -351,6 +615,175 @@ class TestSanitizeFile:
             if temp_dir.exists():
                 temp_dir.rmdir()
 
+    def test_sanitize_file_streams_records_in_chunks(self):
+        """Test that streamed output matches sanitizing all records at once."""
+        records = [{"name": "secret", "id": i, "tags": ["secret", "é"]} for i in range(5)]
+        expected = Sanitizer(
+            [MockDetector("secret", PIIType.EMAIL)], Replacer(seed=42)
+        ).sanitize_records(records)
+
+        sanitizer = Sanitizer([MockDetector("secret", PIIType.EMAIL)], Replacer(seed=42))
+        sanitizer.STREAM_CHUNK_SIZE = 2
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "input.json"
+            output_path = Path(tmpdir) / "output.json"
+            input_path.write_text(json.dumps(records))
+
+            result = sanitizer.sanitize_file(input_path, output_path)
+
+            assert result.success is True
+            assert result.records_processed == 5
+            assert result.pii_replacements_made == 10
+            # Same layout as writing the whole list with json.dump(indent=2)
+            assert output_path.read_text(encoding="utf-8") == json.dumps(
+                expected, indent=2, ensure_ascii=False
+            )
+            # No temporary files are left behind
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == [
+                "input.json",
+                "output.json",
+            ]
+
+    def test_sanitize_file_failure_keeps_existing_output(self):
+        """Test that a record failing mid-stream does not clobber the output."""
+        sanitizer = Sanitizer([MockDetector("secret", PIIType.EMAIL)], Replacer(seed=42))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "input.json"
+            output_path = Path(tmpdir) / "output.json"
+            input_path.write_text('[{"name": "secret"}, 42]')
+            output_path.write_text("previous")
+
+            result = sanitizer.sanitize_file(input_path, output_path)
+
+            assert result.success is False
+            assert output_path.read_text() == "previous"
+            assert len(list(Path(tmpdir).iterdir())) == 2
+
+    def test_write_failure_keeps_existing_output(self, monkeypatch):
+        """Test that a failed whole-file write leaves the old output in place."""
+        sanitizer = Sanitizer([MockDetector("secret", PIIType.EMAIL)], Replacer(seed=42))
+
+        def fail_serialize(data):
+            raise ValueError("cannot serialize")
+
+        monkeypatch.setattr(sanitizer, "_serialize_json", fail_serialize)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "output.json"
+            output_path.write_text("previous")
+
+            with pytest.raises(InvalidOutputPathError):
+                sanitizer._write_json_file(output_path, [{"name": "clean"}])
+
+            assert output_path.read_text() == "previous"
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["output.json"]
+
+    def test_sanitize_files_shares_replacements_across_files(self):
+        """Test that one sanitizer keeps fake values consistent across files."""
+        sanitizer = Sanitizer([EmailDetector()], Replacer(seed=42), workers=2)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first_input = Path(tmpdir) / "first.json"
+            second_input = Path(tmpdir) / "second.json"
+            first_input.write_text('[{"email": "jane@example.com"}]')
+            second_input.write_text('[{"contact": "jane@example.com"}]')
+            pairs = [
+                (first_input, Path(tmpdir) / "first_out.json"),
+                (Path(tmpdir) / "missing.json", Path(tmpdir) / "missing_out.json"),
+                (second_input, Path(tmpdir) / "second_out.json"),
+            ]
+
+            results = sanitizer.sanitize_files(pairs)
+
+            assert [result.success for result in results] == [True, False, True]
+            first = json.loads(pairs[0][1].read_text())
+            second = json.loads(pairs[2][1].read_text())
+            assert first[0]["email"] != "jane@example.com"
+            assert second[0]["contact"] == first[0]["email"]
+            assert sanitizer._executor is None
+
+    def test_sanitize_bytes_matches_sanitize_file(self):
+        """Test that in-memory sanitization produces the same document."""
+        data = json.dumps([{"name": "secret", "tags": ["secret", 1]}, {"age": 30}]).encode()
+        file_sanitizer = Sanitizer([MockDetector("secret", PIIType.EMAIL)], Replacer(seed=42))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "input.json"
+            output_path = Path(tmpdir) / "output.json"
+            input_path.write_bytes(data)
+            expected_result = file_sanitizer.sanitize_file(input_path, output_path)
+            expected_content = output_path.read_bytes()
+
+        # Faker seeds globally, so reseed only after the file run
+        bytes_sanitizer = Sanitizer([MockDetector("secret", PIIType.EMAIL)], Replacer(seed=42))
+        result, content = bytes_sanitizer.sanitize_bytes(data)
+
+        assert result == expected_result
+        assert content == expected_content
+
+    def test_sanitize_bytes_streams_arrays_in_chunks(self):
+        """Test that arrays are sanitized chunk by chunk, falling back for NaN."""
+        sanitizer = Sanitizer([MockDetector("secret", PIIType.EMAIL)], Replacer(seed=42))
+        sanitizer.STREAM_CHUNK_SIZE = 2
+        chunk_sizes = []
+        sanitize_records = sanitizer.sanitize_records
+
+        def tracking_sanitize_records(records):
+            chunk_sizes.append(len(records))
+            return sanitize_records(records)
+
+        sanitizer.sanitize_records = tracking_sanitize_records
+        records = [{"id": i, "name": "clean"} for i in range(5)]
+
+        result, content = sanitizer.sanitize_bytes(json.dumps(records).encode())
+
+        assert result.records_processed == 5
+        assert chunk_sizes == [2, 2, 1]
+        assert content == json.dumps(records, indent=2).encode()
+
+        result, content = sanitizer.sanitize_bytes(b'[{"score": NaN}]')
+
+        assert result.success is True
+        assert content == b'[\n  {\n    "score": NaN\n  }\n]'
+
+    def test_sanitize_bytes_shares_one_pool_across_chunks(self):
+        """Test that parallel in-memory sanitization starts a single process pool."""
+        records = [{"email": f"user{i}@example.com"} for i in range(8)]
+        data = json.dumps(records).encode()
+        expected = Sanitizer([EmailDetector()], Replacer(seed=42)).sanitize_bytes(data)
+
+        sanitizer = Sanitizer([EmailDetector()], Replacer(seed=42), workers=2)
+        sanitizer.STREAM_CHUNK_SIZE = 4
+        sanitizer.PARALLEL_CHUNK_SIZE = 2
+        pools = []
+        create_detection_pool = sanitizer._create_detection_pool
+
+        def tracking_create_detection_pool(max_workers):
+            pools.append(max_workers)
+            return create_detection_pool(max_workers)
+
+        sanitizer._create_detection_pool = tracking_create_detection_pool
+
+        assert sanitizer.sanitize_bytes(data) == expected
+        assert pools == [2]
+        assert sanitizer._executor is None
+
+    def test_sanitize_bytes_invalid_json(self):
+        """Test that invalid or non-array JSON yields a failed result."""
+        sanitizer = Sanitizer([MockDetector("secret", PIIType.EMAIL)], Replacer(seed=42))
+
+        result, content = sanitizer.sanitize_bytes(b'[{"name": "secret"')
+        assert result.success is False
+        assert "Invalid JSON" in result.error_message
+        assert content is None
+
+        result, content = sanitizer.sanitize_bytes(b'{"name": "secret"}')
+        assert result.success is False
+        assert "array" in result.error_message
+        assert content is None
+
 
 class TestStructurePreservation:
     """Tests for structure preservation during sanitization."""
@@ -434,6 +867,23 @@ class TestErrorHandling:
         finally:
             input_path.unlink(missing_ok=True)
 
+    def test_read_write_preserves_values_outside_orjson_range(self):
+        """Test that NaN and big integers round-trip through read and write."""
+        detector = MockDetector("secret", PIIType.EMAIL)
+        replacer = Replacer(seed=42)
+        sanitizer = Sanitizer([detector], replacer)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "input.json"
+            output_path = Path(tmpdir) / "output.json"
+            input_path.write_text('[{"big": 123456789012345678901234, "score": NaN}]')
+
+            data = sanitizer._read_json_file(input_path)
+            sanitizer._write_json_file(output_path, data)
+
+            assert data[0]["big"] == 123456789012345678901234
+            assert output_path.read_text() == json.dumps(data, indent=2)
+
     def test_write_json_file_success(self):
         """Test writing JSON file succeeds."""
         detector = MockDetector("secret", PIIType.EMAIL)
@@ -4,10 +4,8 @@ import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
-from data_sanitizer.detectors.credit_card_detector import CreditCardDetector
-from data_sanitizer.detectors.email_detector import EmailDetector
+from data_sanitizer.detectors.multi_regex_detector import MultiRegexDetector
 from data_sanitizer.detectors.name_detector import NameDetector
-from data_sanitizer.detectors.phone_detector import PhoneDetector
 from data_sanitizer.sanitizer import Sanitizer
 from data_sanitizer.streamlit_app import initialize_sanitizer, validate_output_filename
 
@@ -78,7 +76,7 @@ def test_initialize_sanitizer_property(num_calls: int) -> None:
     **Validates: Requirements 4.1, 4.2**
 
     This property test verifies that every call to initialize_sanitizer() returns
-    a Sanitizer instance with exactly 4 detectors of the correct types.
+    a Sanitizer instance with exactly 2 detectors of the correct types.
     """
     for _ in range(num_calls):
         sanitizer = initialize_sanitizer()
@@ -86,13 +84,13 @@ def test_initialize_sanitizer_property(num_calls: int) -> None:
         # Property 1: Must return a Sanitizer instance
         assert isinstance(sanitizer, Sanitizer), "Expected Sanitizer instance"
 
-        # Property 2: Must have exactly 4 detectors
+        # Property 2: Must have exactly 2 detectors
         num_detectors = len(sanitizer._detectors)
-        assert num_detectors == 4, f"Expected 4 detectors, got {num_detectors}"
+        assert num_detectors == 2, f"Expected 2 detectors, got {num_detectors}"
 
         # Property 3: Must have correct detector types
         detector_types = {type(detector) for detector in sanitizer._detectors}
-        expected_types = {EmailDetector, PhoneDetector, NameDetector, CreditCardDetector}
+        expected_types = {MultiRegexDetector, NameDetector}
         assert detector_types == expected_types, f"Expected {expected_types}, got {detector_types}"
 
         # Property 4: Replacer must be configured
@@ -110,12 +108,12 @@ def test_initialize_sanitizer_has_correct_detector_types() -> None:
     """Test that the sanitizer has the correct detector types."""
     sanitizer = initialize_sanitizer()
 
-    # Check we have exactly 4 detectors
-    assert len(sanitizer._detectors) == 4
+    # Check we have exactly 2 detectors
+    assert len(sanitizer._detectors) == 2
 
     # Check detector types
     detector_types = {type(detector) for detector in sanitizer._detectors}
-    expected_types = {EmailDetector, PhoneDetector, NameDetector, CreditCardDetector}
+    expected_types = {MultiRegexDetector, NameDetector}
     assert detector_types == expected_types
 
 
@@ -131,6 +129,16 @@ def test_initialize_sanitizer_replacer_configured_correctly() -> None:
     assert isinstance(sanitizer._replacer, Replacer)
 
 
+
+def test_initialize_sanitizer_reuses_detectors_but_not_replacer() -> None:
+    """Test that detectors are cached while each sanitizer gets a fresh replacer."""
+    first = initialize_sanitizer()
+    second = initialize_sanitizer()
+
+    assert all(a is b for a, b in zip(first._detectors, second._detectors))
+    assert first._replacer is not second._replacer
+
+
 # Unit tests for process_sanitization
 def test_process_sanitization_successful() -> None:
     """Test successful sanitization returns result and file content."""
@@ -185,10 +193,9 @@ def test_process_sanitization_failed() -> None:
     assert content is None
 
 
-def test_process_sanitization_temporary_files_cleaned_up() -> None:
-    """Test temporary files are cleaned up after processing."""
-    import os
-    from unittest.mock import Mock
+def test_process_sanitization_does_not_stage_files() -> None:
+    """Test the upload is sanitized in memory rather than through temporary files."""
+    from unittest.mock import Mock, patch
 
     from data_sanitizer.streamlit_app import process_sanitization
 
@@ -197,37 +204,85 @@ def test_process_sanitization_temporary_files_cleaned_up() -> None:
     mock_file = Mock()
     mock_file.getvalue.return_value = json_data
 
-    # Track temporary directory path
-    temp_paths = []
+    # Any file-based sanitization would fail the test
+    with patch.object(Sanitizer, "sanitize_file", side_effect=AssertionError("file I/O used")):
+        result, content = process_sanitization(mock_file, "output.json")
+
+    assert result.success is True
+    assert content is not None
+
 
-    # Monkey-patch TemporaryDirectory to capture the path
-    from tempfile import TemporaryDirectory as OriginalTempDir
+# Unit tests for upload_digest
+def test_upload_digest_depends_only_on_content() -> None:
+    """Test that identical uploads share a digest and different ones do not."""
+    from unittest.mock import Mock
 
-    class TrackedTempDir(OriginalTempDir):
-        def __enter__(self):
-            path = super().__enter__()
-            temp_paths.append(path)
-            return path
+    from data_sanitizer.streamlit_app import upload_digest
 
-    # Replace TemporaryDirectory temporarily
-    import data_sanitizer.streamlit_app as app_module
-    original_tempdir = app_module.TemporaryDirectory
-    app_module.TemporaryDirectory = TrackedTempDir
+    first, same, other = Mock(), Mock(), Mock()
+    first.getvalue.return_value = b'[{"email": "john@example.com"}]'
+    same.getvalue.return_value = b'[{"email": "john@example.com"}]'
+    other.getvalue.return_value = b'[{"email": "jane@example.com"}]'
+
+    assert upload_digest(first) == upload_digest(same)
+    assert upload_digest(first) != upload_digest(other)
 
-    try:
-        # Process sanitization
-        result, content = process_sanitization(mock_file, "output.json")
 
-        # Verify temporary directory was created and cleaned up
-        assert len(temp_paths) == 1
-        temp_dir = temp_paths[0]
+# Unit tests for background sanitization
+def test_start_sanitization_runs_on_executor_thread() -> None:
+    """Test that sanitization runs on the executor rather than the calling thread."""
+    import threading
+    from unittest.mock import Mock, patch
+
+    from data_sanitizer.streamlit_app import collect_sanitization, start_sanitization
+
+    mock_file = Mock()
+    mock_file.getvalue.return_value = b'[{"note": "hello"}]'
+    threads = []
+    original = Sanitizer.sanitize_bytes
+
+    def record_thread(self, data):
+        threads.append(threading.current_thread())
+        return original(self, data)
+
+    with patch.object(Sanitizer, "sanitize_bytes", record_thread):
+        result, content = collect_sanitization(start_sanitization(mock_file))
+
+    assert result.success is True
+    assert content is not None
+    assert threads and threads[0] is not threading.current_thread()
+
+
+def test_start_sanitization_reports_setup_errors_through_future() -> None:
+    """Test that errors building the sanitizer surface as a failed result."""
+    from unittest.mock import Mock, patch
+
+    from data_sanitizer.streamlit_app import collect_sanitization, start_sanitization
+
+    with patch(
+        "data_sanitizer.streamlit_app.initialize_sanitizer",
+        side_effect=RuntimeError("model missing"),
+    ):
+        future = start_sanitization(Mock())
+
+    result, content = collect_sanitization(future)
+    assert result.success is False
+    assert "model missing" in result.error_message
+    assert content is None
+
+
+def test_collect_sanitization_returns_future_result() -> None:
+    """Test that a finished sanitization's result and content are returned as-is."""
+    from concurrent.futures import Future
+
+    from data_sanitizer.models import SanitizationResult
+    from data_sanitizer.streamlit_app import collect_sanitization
 
-        # Verify temporary directory no longer exists
-        assert not os.path.exists(temp_dir), "Temporary directory should be cleaned up"
+    expected = (SanitizationResult(True, 1, 0, 0, None), b"[]")
+    future = Future()
+    future.set_result(expected)
 
-    finally:
-        # Restore original TemporaryDirectory
-        app_module.TemporaryDirectory = original_tempdir
+    assert collect_sanitization(future) == expected
 
 
 